@@ -16,6 +16,17 @@ _REPOS_DIR_HELP = (
 _SUBCOMMANDS = {"commit", "report"}
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    try:
+        n = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {n}")
+    return n
+
+
 def _resolve_repos_dir(args: argparse.Namespace) -> None:
     """Fill args.repos_dir from env var when not given on the command line."""
     if args.repos_dir is not None:
@@ -38,11 +49,13 @@ def _build_maintain_parser() -> argparse.ArgumentParser:
         description="Compliance audit and maintenance CLI for the tsilva GitHub organization",
     )
     parser.add_argument("repos_dir", nargs="?", default=None, type=Path, help=_REPOS_DIR_HELP)
-    parser.add_argument("-f", "--filter", dest="filter_pattern", default="", help="Only process repos matching pattern")
+    parser.add_argument("-f", "--filter", dest="filter_pattern", default="", help="Only process repos whose name contains pattern (or matches a glob like 'foo-*')")
     parser.add_argument("-j", "--json", dest="json_output", action="store_true", help="Output JSON report to stdout")
     parser.add_argument("-n", "--dry-run", dest="dry_run", action="store_true", help="Check and show what would be fixed without modifying files")
     parser.add_argument("--rule", dest="rule_filter", default=None, help="Run only this rule ID")
     parser.add_argument("--category", dest="category_filter", default=None, help="Run only rules in this category")
+    parser.add_argument("--no-cache", dest="no_cache", action="store_true", help="Bypass gh's cached GitHub API responses")
+    parser.add_argument("-w", "--workers", type=_positive_int, default=None, help="Repos checked in parallel (default: up to 8)")
     return parser
 
 
@@ -53,7 +66,7 @@ def _build_commit_parser() -> argparse.ArgumentParser:
         description="Interactive AI-assisted commit & push for dirty repos",
     )
     parser.add_argument("repos_dir", nargs="?", default=None, type=Path, help=_REPOS_DIR_HELP)
-    parser.add_argument("-f", "--filter", dest="filter_pattern", default="", help="Only process repos matching pattern")
+    parser.add_argument("-f", "--filter", dest="filter_pattern", default="", help="Only process repos whose name contains pattern (or matches a glob like 'foo-*')")
     parser.add_argument("-n", "--dry-run", dest="dry_run", action="store_true", help="Show dirty repos without committing")
     return parser
 
@@ -66,7 +79,7 @@ def _build_report_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument("report_type", choices=["taglines", "tracked-ignored"], help="Report type")
     parser.add_argument("repos_dir", nargs="?", default=None, type=Path, help=_REPOS_DIR_HELP)
-    parser.add_argument("-f", "--filter", dest="filter_pattern", default="", help="Only process repos matching pattern")
+    parser.add_argument("-f", "--filter", dest="filter_pattern", default="", help="Only process repos whose name contains pattern (or matches a glob like 'foo-*')")
     return parser
 
 
@@ -115,6 +128,11 @@ def main(argv: list[str] | None = None) -> None:
             print(f"Error: Directory does not exist: {args.repos_dir}", file=sys.stderr)
             sys.exit(1)
 
+        if args.no_cache:
+            from gitguard import github
+
+            github.disable_cache()
+
         from gitguard.engine import RuleRunner
 
         runner = RuleRunner(
@@ -122,6 +140,7 @@ def main(argv: list[str] | None = None) -> None:
             filter_pattern=args.filter_pattern,
             rule_filter=args.rule_filter,
             category_filter=args.category_filter,
+            workers=args.workers,
         )
         sys.exit(runner.run(
             dry_run=args.dry_run,
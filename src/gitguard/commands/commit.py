@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 import sys
 import urllib.request
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 from gitguard import git, output
@@ -14,6 +14,50 @@ from gitguard.repo import Repo
 OPENROUTER_BASE_URL = "http://127.0.0.1:8082/api"
 OPENROUTER_MODEL = "anthropic/claude-opus-4.5"
 
+# A 100-token completion is well under 4 KiB; anything past this cap is not a
+# response we can use, so stop reading instead of buffering it.
+_MAX_RESPONSE_BYTES = 64 * 1024
+
+
+def _generate_message(context: str) -> str:
+    """Ask the LLM for a one-line commit message; return "" on any failure."""
+    payload = {
+        "model": OPENROUTER_MODEL,
+        "messages": [
+            {
+                "role": "system",
+                "content": "Generate a concise git commit message (one line, no quotes, no prefix like 'feat:') for these changes. Only output the message, nothing else.",
+            },
+            {"role": "user", "content": context},
+        ],
+        "max_tokens": 100,
+    }
+    try:
+        # Compact, non-escaped UTF-8: diffs are the bulk of the payload and
+        # \uXXXX escapes would inflate any non-ASCII content sixfold.
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        req = urllib.request.Request(
+            f"{OPENROUTER_BASE_URL}/v1/chat/completions",
+            data=body,
+            headers={"Content-Type": "application/json; charset=utf-8"},
+            method="POST",
+        )
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            raw = resp.read(_MAX_RESPONSE_BYTES + 1)
+        if len(raw) > _MAX_RESPONSE_BYTES:
+            return ""
+        data = json.loads(raw)
+        return data["choices"][0]["message"]["content"].strip().replace("\n", " ")
+    except Exception:
+        return ""
+
+
+def _push(repo: Repo) -> bool | None:
+    """Push *repo*; None when it has no remote to push to."""
+    if not git.has_remote(repo.path):
+        return None
+    return git.push(repo.path)
+
 
 def run_commit(repos_dir: Path, filter_pattern: str, dry_run: bool) -> int:
     repos = Repo.discover(repos_dir, filter_pattern)
@@ -27,9 +71,10 @@ def run_commit(repos_dir: Path, filter_pattern: str, dry_run: bool) -> int:
         print(f"{output.YELLOW}DRY RUN MODE - no changes will be made{output.NC}", file=sys.stderr)
     print("", file=sys.stderr)
 
-    # Phase 1: Find dirty repos (parallel status check)
+    # Phase 1: Find dirty repos (parallel status check). Untracked files are
+    # listed individually so Phase 2 can reuse them without another git call.
     def _check_dirty(repo: Repo) -> tuple[Repo, str]:
-        return (repo, git.status_porcelain(repo.path))
+        return (repo, git.status_porcelain(repo.path, untracked_all=True))
 
     with ThreadPoolExecutor(max_workers=min(8, len(repos))) as pool:
         results = list(pool.map(_check_dirty, repos))
@@ -54,6 +99,11 @@ def run_commit(repos_dir: Path, filter_pattern: str, dry_run: bool) -> int:
     skipped = 0
     failed = 0
 
+    # Pushes run in the background while the next repo is being reviewed;
+    # their results are reported in order once the loop is done.
+    push_pool = ThreadPoolExecutor(max_workers=4)
+    pushes: list[tuple[Repo, Future[bool | None]]] = []
+
     for i, (repo, status) in enumerate(dirty_repos, 1):
         output.header(f"[{i}/{len(dirty_repos)}] {repo.name}")
 
@@ -67,36 +117,14 @@ def run_commit(repos_dir: Path, filter_pattern: str, dry_run: bool) -> int:
 
         # Get full diff for AI context (not displayed)
         diff_plain = git.diff_head(repo.path, max_lines=200)
-        untracked = git.untracked_files(repo.path)
+        untracked = git.untracked_from_status(status)
 
         # Generate AI commit message
         context = f"Changes:\n{diff_plain}"
         if untracked:
             context += f"\n\nNew untracked files:\n{untracked}"
 
-        try:
-            body = json.dumps({
-                "model": OPENROUTER_MODEL,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "Generate a concise git commit message (one line, no quotes, no prefix like 'feat:') for these changes. Only output the message, nothing else.",
-                    },
-                    {"role": "user", "content": context},
-                ],
-                "max_tokens": 100,
-            }).encode()
-            req = urllib.request.Request(
-                f"{OPENROUTER_BASE_URL}/v1/chat/completions",
-                data=body,
-                headers={"Content-Type": "application/json"},
-                method="POST",
-            )
-            with urllib.request.urlopen(req, timeout=30) as resp:
-                data = json.loads(resp.read())
-            msg = data["choices"][0]["message"]["content"].strip().replace("\n", " ")
-        except Exception:
-            msg = ""
+        msg = _generate_message(context)
 
         # Prompt for approval
         if msg:
@@ -134,24 +162,30 @@ def run_commit(repos_dir: Path, filter_pattern: str, dry_run: bool) -> int:
             skipped += 1
             continue
 
-        # Commit & push immediately
+        # Commit now, push in the background
         if git.add_all(repo.path) and git.commit(repo.path, final_msg):
             output.success(f"{repo.name} (committed)")
             committed += 1
-
-            if git.has_remote(repo.path):
-                if git.push(repo.path):
-                    output.success(f"{repo.name} (pushed)")
-                    pushed += 1
-                else:
-                    output.error(f"{repo.name} (push failed)")
-                    failed += 1
-            else:
-                output.warn(f"{repo.name} (no remote, skipping push)")
+            pushes.append((repo, push_pool.submit(_push, repo)))
         else:
             output.error(f"{repo.name} (commit failed)")
             failed += 1
 
+    if pushes:
+        print("", file=sys.stderr)
+        output.info(f"Waiting for {len(pushes)} push(es)...")
+    push_pool.shutdown(wait=True)
+    for repo, future in pushes:
+        result = future.result()
+        if result is None:
+            output.warn(f"{repo.name} (no remote, skipping push)")
+        elif result:
+            output.success(f"{repo.name} (pushed)")
+            pushed += 1
+        else:
+            output.error(f"{repo.name} (push failed)")
+            failed += 1
+
     print("", file=sys.stderr)
     print(f"Summary:", file=sys.stderr)
     print(f"  Committed: {committed}", file=sys.stderr)
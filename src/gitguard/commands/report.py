@@ -7,7 +7,7 @@ from pathlib import Path
 
 from gitguard import git, output
 from gitguard.repo import Repo
-from gitguard.tagline import extract_tagline
+from gitguard.tagline import tagline_from_text
 
 
 def run_report(report_type: str, repos_dir: Path, filter_pattern: str) -> int:
@@ -28,9 +28,9 @@ def _report_taglines(repos_dir: Path, filter_pattern: str) -> int:
     max_name_width = 4  # "Repo"
 
     for repo in repos:
-        readme = repo.path / "README.md"
-        if readme.is_file():
-            tagline = extract_tagline(str(readme))
+        readme = repo.readme_text
+        if readme is not None:
+            tagline = tagline_from_text(readme)
             if not tagline:
                 tagline = "(no tagline)"
         else:
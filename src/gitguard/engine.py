@@ -3,21 +3,40 @@
 from __future__ import annotations
 
 import json
+import os
 import sys
-import threading
-from concurrent.futures import ThreadPoolExecutor
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from pathlib import Path
 
 from gitguard import git, output
-from gitguard.github import fetch_org_repo_metadata, get_workflow_conclusions
+from gitguard.github import (
+    fetch_org_repo_metadata,
+    fetch_repo_status_bulk,
+    get_repo_description,
+    get_workflow_conclusions,
+)
 from gitguard.progress import ProgressBar
-from gitguard.repo import Repo
-from gitguard.rules import CheckResult, FixOutcome, Rule, Status
+from gitguard.repo import Repo, name_matcher
+from gitguard.rules import Category, CheckResult, FixOutcome, Rule, Status
 from gitguard.rules._registry import discover_rules
 
 
+# RuleResult.status values
+STATUS_PASS = "pass"
+STATUS_SKIP = "skip"
+STATUS_FIXED = "fixed"
+STATUS_FIX_FAILED = "fix_failed"
+STATUS_MANUAL = "manual"
+STATUS_FAILED = "failed"
+
+_OK_STATUSES = frozenset({STATUS_PASS, STATUS_SKIP})
+
+# RuleResult.status -> status reported in --json output; anything else is "failed".
+_JSON_STATUS = {STATUS_PASS: "passed", STATUS_SKIP: "passed", STATUS_FIXED: "fixed"}
+
+
 @dataclass
 class RuleResult:
     """Outcome for a single rule on a single repo."""
@@ -34,23 +53,24 @@ class RepoResult:
     name: str
     path: str
     results: list[RuleResult] = field(default_factory=list)
+    passed: int = field(default=0, init=False)
+    fixed: int = field(default=0, init=False)
+    manual: list[RuleResult] = field(default_factory=list, init=False)
+
+    def add(self, result: RuleResult) -> None:
+        """Record *result* and keep the per-status counters current."""
+        self.results.append(result)
+        if result.status in _OK_STATUSES:
+            self.passed += 1
+        elif result.status == STATUS_FIXED:
+            self.fixed += 1
+        else:
+            self.manual.append(result)
 
     @property
     def total(self) -> int:
         return len(self.results)
 
-    @property
-    def passed(self) -> int:
-        return sum(1 for r in self.results if r.status in ("pass", "skip"))
-
-    @property
-    def fixed(self) -> int:
-        return sum(1 for r in self.results if r.status == "fixed")
-
-    @property
-    def manual(self) -> list[RuleResult]:
-        return [r for r in self.results if r.status in ("manual", "failed", "fix_failed")]
-
     @property
     def all_ok(self) -> bool:
         return len(self.manual) == 0
@@ -65,21 +85,32 @@ class RuleRunner:
         filter_pattern: str = "",
         rule_filter: str | None = None,
         category_filter: str | None = None,
+        workers: int | None = None,
     ):
         self.repos_dir = repos_dir
         self.filter_pattern = filter_pattern
         self.rule_filter = rule_filter
         self.category_filter = category_filter
+        self.workers = workers
         self.rules = discover_rules()
-
-    def _filter_rules(self) -> list[Rule]:
+        self.rules_by_id = {r.id: r for r in self.rules}
+        self._active_rules = self._filter_rules()
+        # Rules that keep the base applies_to() apply everywhere; skip the call.
+        self._gated = frozenset(
+            r.id for r in self._active_rules if type(r).applies_to is not Rule.applies_to
+        )
+
+    def _filter_rules(self) -> tuple[Rule, ...]:
+        """Resolve --rule/--category once; run() reuses the result."""
         rules = self.rules
         if self.rule_filter:
-            rules = [r for r in rules if r.id == self.rule_filter]
+            single = self.rules_by_id.get(self.rule_filter)
+            rules = [single] if single else []
         if self.category_filter:
             cat_upper = self.category_filter.upper().replace(" ", "_")
-            rules = [r for r in rules if r.category.name == cat_upper]
-        return rules
+            category = Category.__members__.get(cat_upper)
+            rules = [r for r in rules if r.category is category]
+        return tuple(rules)
 
     def run(
         self,
@@ -93,11 +124,13 @@ class RuleRunner:
         org_metadata = fetch_org_repo_metadata("tsilva")
         non_archived = set(org_metadata)
         if non_archived:
-            all_local = {
-                child.name
-                for child in self.repos_dir.iterdir()
-                if child.is_dir() and (child / ".git").is_dir()
-            }
+            # Same test as Repo.discover: dirent type first, one stat for .git.
+            with os.scandir(self.repos_dir) as it:
+                all_local = {
+                    e.name
+                    for e in it
+                    if e.is_dir() and os.path.isdir(os.path.join(e.path, ".git"))
+                }
             archived_names = all_local - non_archived
         else:
             archived_names = None
@@ -108,7 +141,7 @@ class RuleRunner:
         if non_archived:
             to_clone = sorted(non_archived - all_local)
             if self.filter_pattern:
-                to_clone = [n for n in to_clone if self.filter_pattern in n]
+                to_clone = list(filter(name_matcher(self.filter_pattern), to_clone))
             if to_clone:
                 if not json_output:
                     output.step(f"Cloning {len(to_clone)} missing repo(s)\u2026")
@@ -118,32 +151,30 @@ class RuleRunner:
                             output.skip(f"{name} (would clone)")
                         cloned.append(name)
                 else:
-                    errors_lock = threading.Lock()
-
-                    def _clone_one(name: str) -> None:
-                        target = self.repos_dir / name
+                    def _clone_one(name: str) -> tuple[str, str | None]:
+                        """Clone one repo; return (name, error message or None)."""
                         try:
-                            r = git.clone_repo(f"tsilva/{name}", target)
-                            if r.returncode == 0:
+                            r = git.clone_repo(f"tsilva/{name}", self.repos_dir / name)
+                        except Exception as e:
+                            return name, str(e)
+                        return name, None if r.returncode == 0 else r.stderr.strip()
+
+                    # Clones are network-bound; threads just wait on gh, so
+                    # a wider pool than the CPU-bound phases is fine.
+                    with ThreadPoolExecutor(max_workers=min(16, len(to_clone))) as pool:
+                        for name, err in pool.map(_clone_one, to_clone):
+                            if err is None:
                                 if not json_output:
                                     output.success(f"{name} (cloned)")
                                 cloned.append(name)
                             else:
                                 if not json_output:
-                                    output.error(f"{name} (clone failed: {r.stderr.strip()})")
-                                with errors_lock:
-                                    clone_errors.append(name)
-                        except Exception as e:
-                            if not json_output:
-                                output.error(f"{name} (clone failed: {e})")
-                            with errors_lock:
+                                    output.error(f"{name} (clone failed: {err})")
                                 clone_errors.append(name)
 
-                    with ThreadPoolExecutor(max_workers=min(8, len(to_clone))) as pool:
-                        list(pool.map(_clone_one, to_clone))
-
         repos = Repo.discover(self.repos_dir, self.filter_pattern, archived_names=archived_names)
-        rules = self._filter_rules()
+        rules = self._active_rules
+        gated = self._gated
 
         if not repos:
             if not json_output:
@@ -156,74 +187,126 @@ class RuleRunner:
                 repo._prefetch["description"] = org_metadata[repo.name]
             repo._prefetch["github_repo"] = f"tsilva/{repo.name}"
 
-        # Prefetch workflow conclusions in parallel
+        # Prefetch workflow conclusions (and any descriptions the org listing
+        # did not provide) in batched GraphQL calls. Repos whose status was
+        # already fetched during discovery are not queried again.
         if not json_output:
             output.step("Prefetching workflow status\u2026")
-        wf_repos = [r for r in repos if r.has_workflows and r.github_repo]
+        status_repos = [
+            r for r in repos
+            if r.github_repo
+            and "workflow_conclusions" not in r._prefetch
+            and (r.has_workflows or "description" not in r._prefetch)
+        ]
+        bulk: dict[str, dict] = {}
+        if status_repos:
+            bulk = fetch_repo_status_bulk([r.github_repo for r in status_repos])  # type: ignore[misc]
+
+        # Whatever the bulk query missed is fetched per repo, all concurrently,
+        # but only for rules that will actually read it.
+        active_ids = {r.id for r in rules}
+        jobs = []
+        for repo in status_repos:
+            status = bulk.get(repo.github_repo)  # type: ignore[arg-type]
+            if status is not None:
+                repo._prefetch.setdefault("description", status["description"])
+                repo._prefetch["is_archived"] = status["is_archived"]
+                if repo.has_workflows:
+                    repo._prefetch["workflow_conclusions"] = status["workflow_conclusions"]
+                continue
+            if "description" not in repo._prefetch and "REPO_DESCRIPTION" in active_ids:
+                jobs.append((repo, "description", get_repo_description))
+            if repo.has_workflows and "WORKFLOWS_PASSING" in active_ids:
+                jobs.append((repo, "workflow_conclusions", get_workflow_conclusions))
+
+        if jobs:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                futures = {pool.submit(fn, repo.github_repo): (repo, key) for repo, key, fn in jobs}
+                for future in as_completed(futures):
+                    repo, key = futures[future]
+                    repo._prefetch[key] = future.result()
+
+        # Fetch clean repos up front. This phase only waits on the network,
+        # so it runs wider than the rule pool below.
+        if not dry_run:
+            if not json_output:
+                output.step("Fetching\u2026")
 
-        def _fetch_wf(repo: Repo) -> None:
-            repo._prefetch["workflow_conclusions"] = get_workflow_conclusions(repo.github_repo)  # type: ignore[arg-type]
+            def _fetch(repo: Repo) -> None:
+                if repo.is_dirty or not git.needs_fetch(repo.path):
+                    return
+                try:
+                    git.fetch_all(repo.path)
+                except Exception:
+                    pass
+                # Upstream refs moved; re-read ahead counts after the fetch.
+                repo.invalidate()
 
-        with ThreadPoolExecutor(max_workers=8) as pool:
-            pool.map(_fetch_wf, wf_repos)
+            with ThreadPoolExecutor(max_workers=min(32, len(repos))) as pool:
+                list(pool.map(_fetch, repos))
 
         progress = ProgressBar(len(repos) * len(rules)) if not json_output else None
 
         def _process_repo(repo: Repo) -> RepoResult:
             rr = RepoResult(name=repo.name, path=str(repo.path))
-            if not dry_run and not repo.is_dirty:
-                try:
-                    git.fetch_all(repo.path)
-                except Exception:
-                    pass
             try:
                 for rule in rules:
                     if progress:
                         progress.update(repo.name, rule.id, "Checking")
 
-                    if not rule.applies_to(repo):
-                        rr.results.append(RuleResult(rule.id, "skip"))
+                    if rule.required_files and not repo.entries().issuperset(rule.required_files):
+                        rr.add(RuleResult(rule.id, STATUS_SKIP))
+                        continue
+
+                    if rule.id in gated and not rule.applies_to(repo):
+                        rr.add(RuleResult(rule.id, STATUS_SKIP))
                         continue
 
                     result = rule.check(repo)
+                    status = result.status
 
-                    if result.status == Status.PASS:
-                        rr.results.append(RuleResult(rule.id, "pass"))
+                    if status is Status.PASS:
+                        rr.add(RuleResult(rule.id, STATUS_PASS))
                         continue
 
-                    if result.status == Status.SKIP:
-                        rr.results.append(RuleResult(rule.id, "skip"))
+                    if status is Status.SKIP:
+                        rr.add(RuleResult(rule.id, STATUS_SKIP))
                         continue
 
                     # Rule failed — attempt fix
                     if progress:
                         progress.set_phase(repo.name, rule.id, "Fixing")
                     outcome = rule.fix(repo, dry_run=dry_run)
+                    fix_status = outcome.status
 
-                    if outcome.status == FixOutcome.FIXED:
+                    if fix_status == FixOutcome.FIXED:
                         if dry_run:
-                            rr.results.append(RuleResult(rule.id, "fixed", outcome.message))
+                            rr.add(RuleResult(rule.id, STATUS_FIXED, outcome.message))
+                        elif outcome.verified:
+                            repo.invalidate()
+                            rr.add(RuleResult(rule.id, STATUS_FIXED, outcome.message))
                         else:
                             if progress:
                                 progress.set_phase(repo.name, rule.id, "Verifying")
+                            repo.invalidate()
                             verify = rule.check(repo)
-                            if verify.status == Status.PASS:
-                                rr.results.append(RuleResult(rule.id, "fixed", outcome.message))
+                            if verify.status is Status.PASS:
+                                rr.add(RuleResult(rule.id, STATUS_FIXED, outcome.message))
                             else:
-                                rr.results.append(RuleResult(rule.id, "fix_failed", verify.message))
-                    elif outcome.status == FixOutcome.ALREADY_OK:
-                        rr.results.append(RuleResult(rule.id, "pass"))
-                    elif outcome.status == FixOutcome.MANUAL:
-                        rr.results.append(RuleResult(rule.id, "manual", result.message))
-                    elif outcome.status == FixOutcome.SKIPPED:
-                        rr.results.append(RuleResult(rule.id, "manual", outcome.message))
+                                rr.add(RuleResult(rule.id, STATUS_FIX_FAILED, verify.message))
+                    elif fix_status == FixOutcome.ALREADY_OK:
+                        rr.add(RuleResult(rule.id, STATUS_PASS))
+                    elif fix_status == FixOutcome.MANUAL:
+                        rr.add(RuleResult(rule.id, STATUS_MANUAL, result.message))
+                    elif fix_status == FixOutcome.SKIPPED:
+                        rr.add(RuleResult(rule.id, STATUS_MANUAL, outcome.message))
                     else:
-                        rr.results.append(RuleResult(rule.id, "failed", outcome.message))
+                        rr.add(RuleResult(rule.id, STATUS_FAILED, outcome.message))
             except Exception as exc:
-                rr.results.append(RuleResult("INTERNAL", "failed", str(exc)))
+                rr.add(RuleResult("INTERNAL", STATUS_FAILED, str(exc)))
             return rr
 
-        max_workers = min(8, len(repos))
+        max_workers = min(8 if self.workers is None else self.workers, len(repos))
         with ThreadPoolExecutor(max_workers=max_workers) as pool:
             repo_results = list(pool.map(_process_repo, repos))
 
@@ -254,6 +337,13 @@ class RuleRunner:
         needed_fixes = 0
         needs_work = 0
 
+        # Color codes are fixed at import; bake them into the row templates once.
+        bg, nc = output.BG_DARK, output.NC
+        fail_row = f"{bg}{output.RED}\u2717 {nc}{bg}{{:<28}} {{}}{nc}"
+        ok_row = f"{bg}{output.GREEN}\u2713 {nc}{bg}{{:<28}} {{}}{nc}"
+        detail_row = f"{output.DIM}{{}}{nc} {output.RED}{{}}{nc}: {{}}"
+        err = sys.stderr
+
         for rr in repo_results:
             fixed = rr.fixed
             manual = rr.manual
@@ -266,16 +356,17 @@ class RuleRunner:
                 if fixed:
                     parts.append(f"{fixed} fixed")
                 parts.append(f"{len(manual)} manual")
-                print(f"{output.BG_DARK}{output.RED}\u2717 {output.NC}{output.BG_DARK}{rr.name:<28} {', '.join(parts)}{output.NC}", file=sys.stderr)
+                print(fail_row.format(rr.name, ", ".join(parts)), file=err)
+                last = len(manual) - 1
                 for i, m in enumerate(manual):
-                    connector = "└" if i == len(manual) - 1 else "├"
-                    output.detail(f"{output.DIM}{connector}{output.NC} {output.RED}{m.rule_id}{output.NC}: {m.message}")
+                    connector = "└" if i == last else "├"
+                    output.detail(detail_row.format(connector, m.rule_id, m.message))
             elif fixed:
                 needed_fixes += 1
-                print(f"{output.BG_DARK}{output.GREEN}\u2713 {output.NC}{output.BG_DARK}{rr.name:<28} {passed}/{total} passed ({fixed} fixed){output.NC}", file=sys.stderr)
+                print(ok_row.format(rr.name, f"{passed}/{total} passed ({fixed} fixed)"), file=err)
             else:
                 all_passing += 1
-                print(f"{output.BG_DARK}{output.GREEN}\u2713 {output.NC}{output.BG_DARK}{rr.name:<28} {total}/{total} passed{output.NC}", file=sys.stderr)
+                print(ok_row.format(rr.name, f"{total}/{total} passed"), file=err)
 
         # Summary footer
         output.header("Results")
@@ -300,35 +391,34 @@ class RuleRunner:
         json_repos = []
 
         for rr in repo_results:
-            checks = []
-            for r in rr.results:
-                if r.status in ("pass", "skip", "fixed"):
-                    status_str = "passed" if r.status != "fixed" else "fixed"
-                    total_passed += 1
-                else:
-                    status_str = "failed"
-                    total_failed += 1
-                total_checks += 1
-                checks.append({
+            ok = rr.passed + rr.fixed
+            failed = len(rr.manual)
+            total_checks += rr.total
+            total_passed += ok
+            total_failed += failed
+            checks = [
+                {
                     "check": r.rule_id,
-                    "status": status_str,
+                    "status": _JSON_STATUS.get(r.status, "failed"),
                     "message": r.message,
-                })
+                }
+                for r in rr.results
+            ]
 
             json_repos.append({
                 "repo": rr.name,
                 "path": rr.path,
                 "checks": checks,
                 "summary": {
-                    "passed": rr.passed + rr.fixed,
-                    "failed": len(rr.manual),
+                    "passed": ok,
+                    "failed": failed,
                 },
             })
 
         pass_rate = round(total_passed * 100 / total_checks) if total_checks > 0 else 0
 
         report = {
-            "audit_time": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "audit_time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
             "repos_dir": str(self.repos_dir),
             "github_user": github_user,
             "repos_count": len(repo_results),
@@ -342,6 +432,8 @@ class RuleRunner:
         }
         if sync and (sync["cloned"] or sync["clone_errors"]):
             report["sync"] = sync
-        print(json.dumps(report, indent=2))
+        # Stream the encoder's chunks instead of materialising one big string.
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
 
         return 1 if total_failed > 0 else 0
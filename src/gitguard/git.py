@@ -2,28 +2,44 @@
 
 from __future__ import annotations
 
+import os
 import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Union
 
 
-def run_git(repo_path: Path, *args: str, timeout: int = 10) -> subprocess.CompletedProcess:
+def run_git(repo_path: Path, *args: str, timeout: int = 10) -> subprocess.CompletedProcess[bytes]:
+    """Run git in *repo_path*; output stays bytes so callers decode only what they use."""
     return subprocess.run(
         ["git", "-C", str(repo_path), *args],
         capture_output=True,
-        text=True,
         timeout=timeout,
     )
 
 
-def status_porcelain(repo_path: Path) -> str:
-    r = run_git(repo_path, "status", "--porcelain")
-    return r.stdout.strip() if r.returncode == 0 else ""
+def _stdout_str(r: subprocess.CompletedProcess[bytes]) -> str:
+    return r.stdout.decode("utf-8", "replace")
+
+
+def status_porcelain(repo_path: Path, untracked_all: bool = False) -> str:
+    args = ["status", "--porcelain"]
+    if untracked_all:
+        args.append("--untracked-files=all")
+    r = run_git(repo_path, *args)
+    return _stdout_str(r).strip() if r.returncode == 0 else ""
+
+
+def untracked_from_status(porcelain: str) -> str:
+    """Return untracked paths from `status_porcelain` output, one per line."""
+    return "\n".join(line[3:] for line in porcelain.splitlines() if line.startswith("?? "))
 
 
 def unpushed_commits(repo_path: Path) -> str:
     r = run_git(repo_path, "log", "@{u}..", "--oneline")
-    return r.stdout.strip() if r.returncode == 0 else ""
+    return _stdout_str(r).strip() if r.returncode == 0 else ""
 
 
 def has_branch(repo_path: Path, branch: str) -> bool:
@@ -32,10 +48,18 @@ def has_branch(repo_path: Path, branch: str) -> bool:
 
 
 def tracked_ignored_files(repo_path: Path) -> list[str]:
-    r = run_git(repo_path, "ls-files", "-i", "-c", "--exclude-standard")
-    if r.returncode != 0 or not r.stdout.strip():
+    r = run_git(repo_path, "ls-files", "-i", "-c", "--exclude-standard", "-z")
+    if r.returncode != 0 or not r.stdout:
         return []
-    return r.stdout.strip().splitlines()
+    return _stdout_str(r).rstrip("\0").split("\0")
+
+
+def tracked_ignored_count(repo_path: Path) -> int:
+    """Number of tracked files matching gitignore, counted without decoding names."""
+    r = run_git(repo_path, "ls-files", "-i", "-c", "--exclude-standard", "-z")
+    if r.returncode != 0:
+        return 0
+    return r.stdout.count(b"\0")
 
 
 def merged_branches(repo_path: Path) -> list[str]:
@@ -44,7 +68,7 @@ def merged_branches(repo_path: Path) -> list[str]:
         return []
     return [
         b.strip().lstrip("* ")
-        for b in r.stdout.strip().splitlines()
+        for b in _stdout_str(r).strip().splitlines()
         if b.strip().lstrip("* ") not in ("main", "master")
     ]
 
@@ -60,13 +84,46 @@ def branch_ages(repo_path: Path) -> list[tuple[str, int]]:
     if r.returncode != 0 or not r.stdout.strip():
         return []
     result = []
-    for line in r.stdout.strip().splitlines():
+    for line in _stdout_str(r).strip().splitlines():
         parts = line.split()
         if len(parts) == 2:
             result.append((parts[0], int(parts[1])))
     return result
 
 
+@dataclass
+class GitSnapshot:
+    """Working-tree and branch state gathered with two git calls."""
+
+    changes: int = 0
+    ahead: int = 0
+    branches: list[tuple[str, int]] = field(default_factory=list)
+
+
+def snapshot(repo_path: Path) -> GitSnapshot:
+    """Collect what the git-hygiene rules need without one spawn per probe.
+
+    `changes` counts the entries `status --porcelain` would list, `ahead` is
+    the number of commits not on the upstream (0 without one), and `branches`
+    matches `branch_ages`.
+    """
+    snap = GitSnapshot()
+    r = run_git(repo_path, "status", "--porcelain=v2", "--branch", "-z")
+    if r.returncode == 0:
+        records = iter(_stdout_str(r).split("\0"))
+        for rec in records:
+            if rec.startswith("# branch.ab "):
+                snap.ahead = int(rec.split()[2])
+            elif rec.startswith(("1 ", "u ", "? ")):
+                snap.changes += 1
+            elif rec.startswith("2 "):
+                # Renames carry the original path as a separate record.
+                snap.changes += 1
+                next(records, None)
+    snap.branches = branch_ages(repo_path)
+    return snap
+
+
 def add_all(repo_path: Path) -> bool:
     return run_git(repo_path, "add", "-A").returncode == 0
 
@@ -84,23 +141,67 @@ def has_remote(repo_path: Path) -> bool:
     return r.returncode == 0
 
 
-def diff_head(repo_path: Path, max_lines: int = 200, color: bool = False) -> str:
-    args = ["diff", "HEAD"]
-    if color:
-        args.insert(1, "--color=always")
-    r = run_git(repo_path, *args)
-    if r.returncode != 0:
+def user_name(repo_path: Path) -> str:
+    """Configured user.name for *repo_path*, or "" if unset."""
+    try:
+        r = run_git(repo_path, "config", "user.name", timeout=5)
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return ""
+    return _stdout_str(r).strip() if r.returncode == 0 else ""
+
+
+def diff_head(repo_path: Path, max_lines: int = 200, color: bool = False, timeout: float = 10) -> str:
+    """Return the first `max_lines` of `git diff HEAD`, or "" on error or timeout.
+
+    Output is streamed and git is stopped once enough lines have been read,
+    so large diffs are never generated or buffered in full. A timer kills git
+    if the whole read takes longer than *timeout* seconds.
+    """
+    args = ["git", "-C", str(repo_path), "diff", "--color=always" if color else "--no-color", "HEAD"]
+    lines: list[str] = []
+    timed_out = threading.Event()
+    with subprocess.Popen(
+        args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        errors="replace",
+    ) as proc:
+        def _expire() -> None:
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout, _expire)
+        timer.start()
+        try:
+            for line in proc.stdout:
+                lines.append(line.rstrip("\n"))
+                if len(lines) >= max_lines:
+                    proc.kill()
+                    return "\n".join(lines)
+            proc.wait()
+        finally:
+            timer.cancel()
+    if timed_out.is_set() or proc.returncode != 0:
         return ""
-    lines = r.stdout.splitlines()[:max_lines]
     return "\n".join(lines)
 
 
 def untracked_files(repo_path: Path) -> str:
     r = run_git(repo_path, "ls-files", "--others", "--exclude-standard")
-    return r.stdout.strip() if r.returncode == 0 else ""
+    return _stdout_str(r).strip() if r.returncode == 0 else ""
+
+
+def needs_fetch(repo_path: Path, ttl_seconds: int = 900) -> bool:
+    """False if the repo was fetched within *ttl_seconds* (FETCH_HEAD mtime)."""
+    try:
+        mtime = os.stat(os.path.join(repo_path, ".git", "FETCH_HEAD")).st_mtime
+    except OSError:
+        return True
+    return mtime < time.time() - ttl_seconds
 
 
-def fetch_all(repo_path: Path) -> subprocess.CompletedProcess:
+def fetch_all(repo_path: Path) -> subprocess.CompletedProcess[bytes]:
     return run_git(repo_path, "fetch", "--all", timeout=60)
 
 
@@ -2,85 +2,191 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import shutil
 import subprocess
 
 
+# Set by --no-cache; when False, gh's on-disk response cache is never used.
+_cache_enabled = True
+
+
+def disable_cache() -> None:
+    """Make every gh call hit the API instead of gh's response cache."""
+    global _cache_enabled
+    _cache_enabled = False
+
+
+def _cache_args(ttl: str) -> list[str]:
+    return ["--cache", ttl] if _cache_enabled else []
+
+
+def _gh(*args: str, timeout: int = 10) -> subprocess.CompletedProcess:
+    """Run a gh subcommand with captured text output; all gh calls go through here."""
+    return subprocess.run(["gh", *args], capture_output=True, text=True, timeout=timeout)
+
+
+@functools.cache
 def gh_available() -> bool:
     return shutil.which("gh") is not None
 
 
+@functools.cache
 def gh_authenticated() -> bool:
+    """Whether gh is logged in; checked once per process, not per repo."""
     if not gh_available():
         return False
     try:
-        r = subprocess.run(
-            ["gh", "auth", "status"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
+        r = _gh("auth", "status")
         return r.returncode == 0
     except (subprocess.TimeoutExpired, FileNotFoundError):
         return False
 
 
+def _reset_auth_cache() -> None:
+    """Forget cached gh availability/auth results (for tests)."""
+    gh_available.cache_clear()
+    gh_authenticated.cache_clear()
+
+
 def get_repo_description(github_repo: str) -> str:
     try:
-        r = subprocess.run(
-            ["gh", "repo", "view", github_repo, "--json", "description", "-q", '.description // ""'],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
+        r = _gh("repo", "view", github_repo, "--json", "description", "-q", '.description // ""')
         return r.stdout.strip() if r.returncode == 0 else ""
     except (subprocess.TimeoutExpired, FileNotFoundError):
         return ""
 
 
+def get_repo_archived(github_repo: str) -> bool:
+    try:
+        r = _gh("repo", "view", github_repo, "--json", "isArchived", "-q", ".isArchived")
+        return r.returncode == 0 and r.stdout.strip() == "true"
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return False
+
+
+# Newest completed run per workflow, projected by gh's built-in jq so only
+# the final {name: conclusion} object crosses the pipe. unique_by keeps the
+# first run of each group, and gh lists runs newest first.
+_CONCLUSIONS_JQ = (
+    '[.[] | select(.status == "completed" and .workflowName != "" and .conclusion != "")]'
+    " | unique_by(.workflowName) | map({(.workflowName): .conclusion}) | add // {}"
+)
+
+
+def _latest_conclusions(runs: list[dict]) -> dict[str, str]:
+    conclusions: dict[str, str] = {}
+    for run in runs:
+        name = run.get("workflowName")
+        if not name or name in conclusions:
+            continue
+        if run.get("status") != "completed":
+            continue
+        conclusion = run.get("conclusion")
+        if conclusion:
+            conclusions[name] = conclusion
+    return conclusions
+
+
 def get_workflow_conclusions(github_repo: str, branch: str = "main") -> dict[str, str]:
     """Return {workflow_name: conclusion} for latest completed run of each workflow."""
+    args = (
+        "run", "list",
+        "--repo", github_repo,
+        "--branch", branch,
+        "--limit", "50",
+        "--json", "workflowName,conclusion,status",
+    )
     try:
-        r = subprocess.run(
-            [
-                "gh", "run", "list",
-                "--repo", github_repo,
-                "--branch", branch,
-                "--limit", "50",
-                "--json", "workflowName,conclusion,status",
-            ],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
+        r = _gh(*args, "-q", _CONCLUSIONS_JQ)
+        if r.returncode == 0:
+            return json.loads(r.stdout)
+        # The projection failed (e.g. an older gh); filter the raw runs here.
+        r = _gh(*args)
         if r.returncode != 0:
             return {}
-        runs = json.loads(r.stdout)
-        conclusions: dict[str, str] = {}
-        for run in runs:
-            name = run.get("workflowName")
-            if not name or name in conclusions:
-                continue
-            if run.get("status") != "completed":
-                continue
-            conclusion = run.get("conclusion")
-            if conclusion:
-                conclusions[name] = conclusion
-        return conclusions
+        return _latest_conclusions(json.loads(r.stdout))
     except (subprocess.TimeoutExpired, FileNotFoundError, ValueError, KeyError):
         return {}
 
 
+_STATUS_BATCH = 20
+# Workflow conclusions go stale quickly; keep the cached batch short-lived.
+_STATUS_CACHE_TTL = "60s"
+
+_STATUS_FRAGMENT = """
+  %s: repository(owner: %s, name: %s) {
+    description
+    isArchived
+    ref(qualifiedName: %s) {
+      target {
+        ... on Commit {
+          history(first: 5) {
+            nodes {
+              checkSuites(first: 20) {
+                nodes { status conclusion workflowRun { workflow { name } } }
+              }
+            }
+          }
+        }
+      }
+    }
+  }"""
+
+
+def fetch_repo_status_bulk(github_repos: list[str], branch: str = "main") -> dict[str, dict]:
+    """Return {owner/repo: status} for many repos via batched GraphQL calls.
+
+    Each status has "description", "is_archived" and "workflow_conclusions".
+    The conclusions mirror `get_workflow_conclusions`: for each workflow, the
+    conclusion of its newest completed run among the last few commits on
+    *branch*. Repos missing from the result (query error, no access) should
+    fall back to the per-repo calls.
+    """
+    ref = json.dumps(f"refs/heads/{branch}")
+    result: dict[str, dict] = {}
+    for start in range(0, len(github_repos), _STATUS_BATCH):
+        batch = github_repos[start:start + _STATUS_BATCH]
+        parts = []
+        for i, nwo in enumerate(batch):
+            owner, _, name = nwo.partition("/")
+            parts.append(_STATUS_FRAGMENT % (f"r{i}", json.dumps(owner), json.dumps(name), ref))
+        query = "query {%s\n}" % "".join(parts)
+        try:
+            r = _gh("api", "graphql", *_cache_args(_STATUS_CACHE_TTL), "-f", f"query={query}", timeout=30)
+            # Partial errors (e.g. one missing repo) still return data for the rest.
+            payload = json.loads(r.stdout)
+        except (subprocess.TimeoutExpired, FileNotFoundError, ValueError):
+            continue
+        data = (payload.get("data") if isinstance(payload, dict) else None) or {}
+        for i, nwo in enumerate(batch):
+            node = data.get(f"r{i}")
+            if node is None:
+                continue
+            conclusions: dict[str, str] = {}
+            commits = (((node.get("ref") or {}).get("target") or {}).get("history") or {}).get("nodes") or []
+            for commit in commits:
+                for suite in (commit.get("checkSuites") or {}).get("nodes") or []:
+                    run = suite.get("workflowRun")
+                    if not run or suite.get("status") != "COMPLETED" or not suite.get("conclusion"):
+                        continue
+                    workflow = (run.get("workflow") or {}).get("name")
+                    if not workflow:
+                        continue
+                    conclusions.setdefault(workflow, suite["conclusion"].lower())
+            result[nwo] = {
+                "description": node.get("description") or "",
+                "is_archived": bool(node.get("isArchived")),
+                "workflow_conclusions": conclusions,
+            }
+    return result
+
+
 def list_org_repos(org: str) -> list[str]:
     """Return sorted list of non-archived repo names for the given GitHub org."""
     try:
-        r = subprocess.run(
-            ["gh", "repo", "list", org, "--no-archived", "--json", "name", "--limit", "1000"],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
+        r = _gh("repo", "list", org, "--no-archived", "--json", "name", "--limit", "1000", timeout=30)
         if r.returncode != 0:
             return []
         repos = json.loads(r.stdout)
@@ -89,6 +195,11 @@ def list_org_repos(org: str) -> list[str]:
         return []
 
 
+# gh keeps its own on-disk HTTP cache; repeat runs within this window reuse
+# the repo listing instead of paging through the API again.
+_METADATA_CACHE_TTL = "5m"
+
+
 def fetch_org_repo_metadata(org: str) -> dict[str, str]:
     """Return {repo_name: description} for non-archived repos via a single GraphQL call.
 
@@ -108,13 +219,14 @@ query($owner: String!, $cursor: String) {
     try:
         while True:
             cmd = [
-                "gh", "api", "graphql",
+                "api", "graphql",
+                *_cache_args(_METADATA_CACHE_TTL),
                 "-f", f"query={query}",
                 "-f", f"owner={org}",
             ]
             if cursor:
                 cmd.extend(["-f", f"cursor={cursor}"])
-            r = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            r = _gh(*cmd, timeout=30)
             if r.returncode != 0:
                 return result or {}
             data = json.loads(r.stdout)
@@ -134,12 +246,7 @@ query($owner: String!, $cursor: String) {
 
 def set_repo_description(github_repo: str, description: str) -> bool:
     try:
-        r = subprocess.run(
-            ["gh", "repo", "edit", github_repo, "--description", description],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
+        r = _gh("repo", "edit", github_repo, "--description", description)
         return r.returncode == 0
     except (subprocess.TimeoutExpired, FileNotFoundError):
         return False
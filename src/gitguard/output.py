@@ -24,29 +24,38 @@ DIM = "\033[2m" if _COLOR else ""
 BG_DARK = "\033[48;5;236m" if _COLOR else ""
 NC = "\033[0m" if _COLOR else ""
 
+# Status glyphs with their color codes, built once; without color these are
+# just the bare glyph.
+_SUCCESS = f"{GREEN}\u2713{NC}"
+_ERROR = f"{RED}\u2717{NC}"
+_WARN = f"{YELLOW}\u26a0{NC}"
+_INFO = f"{BLUE}\u2139{NC}"
+_STEP = f"{BLUE}\u21bb{NC}"
+_SKIP = f"{YELLOW}\u2192{NC}"
+
 
 def success(msg: str) -> None:
-    print(f"{GREEN}\u2713{NC} {msg}", file=sys.stderr)
+    print(_SUCCESS, msg, file=sys.stderr)
 
 
 def error(msg: str) -> None:
-    print(f"{RED}\u2717{NC} {msg}", file=sys.stderr)
+    print(_ERROR, msg, file=sys.stderr)
 
 
 def warn(msg: str) -> None:
-    print(f"{YELLOW}\u26a0{NC} {msg}", file=sys.stderr)
+    print(_WARN, msg, file=sys.stderr)
 
 
 def info(msg: str) -> None:
-    print(f"{BLUE}\u2139{NC} {msg}", file=sys.stderr)
+    print(_INFO, msg, file=sys.stderr)
 
 
 def step(msg: str) -> None:
-    print(f"{BLUE}\u21bb{NC} {msg}", file=sys.stderr)
+    print(_STEP, msg, file=sys.stderr)
 
 
 def skip(msg: str) -> None:
-    print(f"{YELLOW}\u2192{NC} {msg}", file=sys.stderr)
+    print(_SKIP, msg, file=sys.stderr)
 
 
 def detail(msg: str) -> None:
@@ -2,10 +2,22 @@
 
 from __future__ import annotations
 
+import fnmatch
+import functools
+import os
 import re
 import subprocess
+import tomllib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from gitguard.git import GitSnapshot
+
+
+_CI_WORKFLOW_RE = re.compile(r"tsilva/\.github/.*/(test|release|ci)\.yml|pytest")
 
 
 @dataclass
@@ -35,13 +47,52 @@ class Repo:
                 self._cache["github_repo"] = self._extract_github_repo()
         return self._cache["github_repo"]
 
+    @property
+    def workflow_files(self) -> list[tuple[Path, str]]:
+        """(path, text) for each .github/workflows/*.yml|yaml, read once."""
+        if "workflow_files" not in self._cache:
+            files = []
+            wf_dir = self.path / ".github" / "workflows"
+            try:
+                with os.scandir(wf_dir) as it:
+                    names = sorted(e.name for e in it if e.name.endswith((".yml", ".yaml")))
+            except OSError:
+                names = []
+            for name in names:
+                wf_file = wf_dir / name
+                try:
+                    files.append((wf_file, wf_file.read_text(encoding="utf-8", errors="replace")))
+                except OSError:
+                    continue
+            self._cache["workflow_files"] = files
+        return self._cache["workflow_files"]
+
+    @property
+    def readme_text(self) -> str | None:
+        """Contents of README.md, read once; None if it does not exist."""
+        if "readme_text" not in self._cache:
+            try:
+                text = (self.path / "README.md").read_text(encoding="utf-8", errors="replace")
+            except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+                text = None
+            self._cache["readme_text"] = text
+        return self._cache["readme_text"]
+
+    @property
+    def gitignore_text(self) -> str | None:
+        """Contents of .gitignore, read once; None if it does not exist."""
+        if "gitignore_text" not in self._cache:
+            try:
+                text = (self.path / ".gitignore").read_text(encoding="utf-8", errors="replace")
+            except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+                text = None
+            self._cache["gitignore_text"] = text
+        return self._cache["gitignore_text"]
+
     @property
     def has_workflows(self) -> bool:
         if "has_workflows" not in self._cache:
-            wf_dir = self.path / ".github" / "workflows"
-            self._cache["has_workflows"] = wf_dir.is_dir() and any(
-                f.suffix in (".yml", ".yaml") for f in wf_dir.iterdir()
-            )
+            self._cache["has_workflows"] = bool(self.workflow_files)
         return self._cache["has_workflows"]
 
     @property
@@ -57,11 +108,49 @@ class Repo:
         return self._cache["is_archived"]
 
     @property
-    def is_dirty(self) -> bool:
-        if "is_dirty" not in self._cache:
+    def git_snapshot(self) -> GitSnapshot:
+        if "git_snapshot" not in self._cache:
+            from gitguard import git
+            self._cache["git_snapshot"] = git.snapshot(self.path)
+        return self._cache["git_snapshot"]
+
+    @property
+    def branches(self) -> frozenset[str]:
+        """Local branch names, from the git snapshot."""
+        return frozenset(name for name, _ in self.git_snapshot.branches)
+
+    @property
+    def git_user_name(self) -> str:
+        """Committer name from git config, falling back to "Author"."""
+        if "git_user_name" not in self._cache:
             from gitguard import git
-            self._cache["is_dirty"] = bool(git.status_porcelain(self.path))
-        return self._cache["is_dirty"]
+            self._cache["git_user_name"] = git.user_name(self.path) or "Author"
+        return self._cache["git_user_name"]
+
+    @property
+    def is_dirty(self) -> bool:
+        return self.git_snapshot.changes > 0
+
+    def entries(self, subdir: str = "") -> frozenset[str]:
+        """Names directly inside the repo root (or *subdir*), listed once and cached."""
+        key = f"entries:{subdir}"
+        if key not in self._cache:
+            try:
+                with os.scandir(self.path / subdir) as it:
+                    self._cache[key] = frozenset(e.name for e in it)
+            except OSError:
+                self._cache[key] = frozenset()
+        return self._cache[key]
+
+    def invalidate(self) -> None:
+        """Drop cached on-disk state after the working tree or refs changed.
+
+        Remote-derived values (github_repo, is_archived) and git config
+        (git_user_name) are kept.
+        """
+        for key in list(self._cache):
+            if key not in ("github_repo", "is_archived", "git_user_name"):
+                del self._cache[key]
 
     @property
     def has_pyproject(self) -> bool:
@@ -95,42 +184,49 @@ class Repo:
             self._cache["has_version"] = self._check_version()
         return self._cache["has_version"]
 
+    @property
+    def pyproject_data(self) -> dict | None:
+        """Parsed pyproject.toml, loaded once; None if missing or invalid."""
+        if "pyproject_data" not in self._cache:
+            try:
+                raw = (self.path / "pyproject.toml").read_bytes()
+                self._cache["pyproject_data"] = tomllib.loads(raw.decode("utf-8"))
+            except Exception as e:
+                self._cache["pyproject_data"] = None
+                self._cache["pyproject_error"] = str(e)
+        return self._cache["pyproject_data"]
+
+    @property
+    def pyproject_error(self) -> str:
+        """Why pyproject_data is None ("" when it parsed fine)."""
+        if self.pyproject_data is not None:
+            return ""
+        return self._cache["pyproject_error"]
+
     def _parse_package_name(self) -> str | None:
-        pyproject = self.path / "pyproject.toml"
-        if not pyproject.is_file():
+        data = self.pyproject_data
+        if data is None:
             return None
         try:
-            import tomllib
-
-            with open(pyproject, "rb") as f:
-                data = tomllib.load(f)
             return data.get("project", {}).get("name") or None
         except Exception:
             return None
 
     def _parse_cli_scripts(self) -> dict[str, str]:
-        pyproject = self.path / "pyproject.toml"
-        if not pyproject.is_file():
+        data = self.pyproject_data
+        if data is None:
             return {}
         try:
-            import tomllib
-
-            with open(pyproject, "rb") as f:
-                data = tomllib.load(f)
             scripts = data.get("project", {}).get("scripts", {})
             return dict(scripts) if scripts else {}
         except Exception:
             return {}
 
     def _check_version(self) -> bool:
-        pyproject = self.path / "pyproject.toml"
-        if not pyproject.is_file():
+        data = self.pyproject_data
+        if data is None:
             return False
         try:
-            import tomllib
-
-            with open(pyproject, "rb") as f:
-                data = tomllib.load(f)
             project = data.get("project", {})
             if project.get("version", ""):
                 return True
@@ -139,48 +235,27 @@ class Repo:
             return False
 
     def _detect_ci_workflow(self) -> bool:
-        wf_dir = self.path / ".github" / "workflows"
-        if not wf_dir.is_dir():
-            return False
-        for wf_file in wf_dir.iterdir():
-            if wf_file.suffix not in (".yml", ".yaml"):
-                continue
-            try:
-                content = wf_file.read_text(encoding="utf-8", errors="replace")
-                if re.search(r"tsilva/\.github/.*/(test|release|ci)\.yml|pytest", content):
-                    return True
-            except Exception:
+        for _, content in self.workflow_files:
+            # Every match contains one of these literals; skip the regex otherwise.
+            if "pytest" not in content and "tsilva/.github" not in content:
                 continue
+            if _CI_WORKFLOW_RE.search(content):
+                return True
         return False
 
     def _check_archived(self) -> bool:
+        if "is_archived" in self._prefetch:
+            return self._prefetch["is_archived"]
         gh_repo = self.github_repo
         if not gh_repo:
             return False
-        try:
-            result = subprocess.run(
-                ["gh", "repo", "view", gh_repo, "--json", "isArchived", "-q", ".isArchived"],
-                capture_output=True, text=True, timeout=10,
-            )
-            return result.returncode == 0 and result.stdout.strip() == "true"
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+        from gitguard import github
+        return github.get_repo_archived(gh_repo)
 
     def _detect_python(self) -> bool:
-        indicators = ["setup.py", "requirements.txt", "setup.cfg", "Pipfile"]
-        for f in indicators:
-            if (self.path / f).is_file():
-                return True
-        if self.has_pyproject:
+        if self.entries() & _PY_INDICATORS:
             return True
-        count = 0
-        for p in self.path.rglob("*.py"):
-            if p.name.startswith("test_") or ".venv" in p.parts or "node_modules" in p.parts:
-                continue
-            count += 1
-            if count > 2:
-                return True
-        return False
+        return _count_py_files(self.path, limit=3) >= 3
 
     def _extract_github_repo(self) -> str | None:
         try:
@@ -197,14 +272,10 @@ class Repo:
             return None
 
     def _check_pyproject_field(self, field_name: str) -> bool:
-        pyproject = self.path / "pyproject.toml"
-        if not pyproject.is_file():
+        data = self.pyproject_data
+        if data is None:
             return False
         try:
-            import tomllib
-
-            with open(pyproject, "rb") as f:
-                data = tomllib.load(f)
             return bool(data.get("project", {}).get(field_name, ""))
         except Exception:
             return False
@@ -219,35 +290,103 @@ class Repo:
         repos = []
         if not repos_dir.is_dir():
             return repos
-        for child in sorted(repos_dir.iterdir()):
-            if not child.is_dir():
+        # DirEntry.is_dir() answers from the cached readdir type, so only the
+        # .git probe costs a stat per entry.
+        with os.scandir(repos_dir) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        matches = name_matcher(filter_pattern)
+        for entry in entries:
+            if not matches(entry.name):
                 continue
-            if not (child / ".git").is_dir():
+            if not entry.is_dir():
                 continue
-            if filter_pattern and filter_pattern not in child.name:
+            if not os.path.isdir(os.path.join(entry.path, ".git")):
                 continue
-            if skip_archived:
-                if archived_names is not None:
-                    if child.name in archived_names:
-                        continue
-                else:
-                    repo = Repo(path=child)
-                    if repo.is_archived:
-                        continue
-                    repos.append(repo)
-                    continue
-            repos.append(Repo(path=child))
+            if skip_archived and archived_names is not None and entry.name in archived_names:
+                continue
+            repos.append(Repo(path=repos_dir / entry.name))
+        if skip_archived and archived_names is None:
+            _prefetch_remote_status(repos)
+            repos = [repo for repo in repos if not repo.is_archived]
         return repos
 
 
+def _prefetch_remote_status(repos: list[Repo]) -> None:
+    """Fill remote status for *repos* with one batched gh query.
+
+    The whole status (archived state, description, workflow conclusions) is
+    kept so the engine does not query the same repos again. Repos the query
+    misses keep the per-repo fallback in `_check_archived`.
+    """
+    if not repos:
+        return
+    # One `git remote get-url` per repo; run them side by side.
+    with ThreadPoolExecutor(max_workers=min(16, len(repos))) as pool:
+        nwos = list(pool.map(lambda r: r.github_repo, repos))
+    by_nwo: dict[str, list[Repo]] = {}
+    for repo, nwo in zip(repos, nwos):
+        if nwo:
+            by_nwo.setdefault(nwo, []).append(repo)
+    if not by_nwo:
+        return
+    from gitguard.github import fetch_repo_status_bulk
+
+    for nwo, status in fetch_repo_status_bulk(list(by_nwo)).items():
+        for repo in by_nwo[nwo]:
+            repo._prefetch["is_archived"] = status["is_archived"]
+            repo._prefetch.setdefault("description", status["description"])
+            repo._prefetch["workflow_conclusions"] = status["workflow_conclusions"]
+
+
+# Root-level files that mark a Python project without scanning for .py files.
+_PY_INDICATORS = frozenset({"setup.py", "requirements.txt", "setup.cfg", "Pipfile", "pyproject.toml"})
+
+
+_PY_SCAN_EXCLUDES = frozenset({".git", ".venv", "node_modules"})
+
+
+def _count_py_files(root: Path, limit: int) -> int:
+    """Count non-test .py files under *root*, stopping once *limit* is reached.
+
+    Excluded directories are pruned during the walk rather than filtered
+    afterwards, so vendored trees are never descended into.
+    """
+    count = 0
+    stack = [str(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _PY_SCAN_EXCLUDES:
+                        stack.append(entry.path)
+                elif entry.name.endswith(".py") and not entry.name.startswith("test_"):
+                    count += 1
+                    if count >= limit:
+                        return count
+    return count
+
+
+def name_matcher(pattern: str) -> Callable[[str], bool]:
+    """Build a repo-name predicate: glob if *pattern* has wildcards, else substring."""
+    if not pattern:
+        return lambda name: True
+    if any(c in pattern for c in "*?["):
+        return re.compile(fnmatch.translate(pattern)).match
+    return lambda name: pattern in name
+
+
+# SSH: git@github.com:owner/repo.git
+_SSH_REMOTE_RE = re.compile(r"git@github\.com:([^/]+/[^/]+?)(?:\.git)?$")
+# HTTPS: https://github.com/owner/repo.git
+_HTTPS_REMOTE_RE = re.compile(r"https?://github\.com/([^/]+/[^/]+?)(?:\.git)?$")
+
+
+@functools.lru_cache(maxsize=512)
 def parse_github_remote(url: str) -> str | None:
     """Parse owner/repo from a git remote URL (HTTPS or SSH)."""
-    # SSH: git@github.com:owner/repo.git
-    m = re.match(r"git@github\.com:([^/]+/[^/]+?)(?:\.git)?$", url)
-    if m:
-        return m.group(1)
-    # HTTPS: https://github.com/owner/repo.git
-    m = re.match(r"https?://github\.com/([^/]+/[^/]+?)(?:\.git)?$", url)
-    if m:
-        return m.group(1)
-    return None
+    m = _SSH_REMOTE_RE.match(url) or _HTTPS_REMOTE_RE.match(url)
+    return m.group(1) if m else None
@@ -27,16 +27,17 @@ class Category(Enum):
     GIT_HYGIENE = "Git Hygiene"
 
 
-@dataclass
+@dataclass(frozen=True)
 class CheckResult:
     status: Status
     message: str = ""
 
 
-@dataclass
+@dataclass(frozen=True)
 class FixOutcome:
     status: str  # "fixed", "already_ok", "skipped", "manual", "failed"
     message: str = ""
+    verified: bool = False  # fix wrote exactly what check() tests; no re-check needed
 
     FIXED = "fixed"
     ALREADY_OK = "already_ok"
@@ -45,12 +46,28 @@ class FixOutcome:
     FAILED = "failed"
 
 
+# Message-less results are immutable and shared rather than rebuilt per check.
+CHECK_PASS = CheckResult(Status.PASS)
+CHECK_SKIP = CheckResult(Status.SKIP)
+FIX_ALREADY_OK = FixOutcome(FixOutcome.ALREADY_OK)
+
+
 class Rule(abc.ABC):
     """Base class for all compliance rules."""
 
     id: str
     name: str
     category: Category
+    # Top-level repo entries without which the rule can only skip; the engine
+    # checks these against one cached directory listing before calling it.
+    required_files: tuple[str, ...] = ()
+
+    # Every subclass, in definition order; read by _registry.discover_rules.
+    _subclasses: list[type[Rule]] = []
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        Rule._subclasses.append(cls)
 
     def applies_to(self, repo: Repo) -> bool:
         """Whether this rule applies to the given repo. Default: True."""
@@ -5,13 +5,14 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from gitguard.repo import Repo
 
 ESSENTIAL_GITIGNORE = [".env", ".DS_Store", "node_modules/", "__pycache__/", "*.pyc", ".venv/"]
 
 
-def has_license_file(repo_path: Path) -> bool:
-    for name in ("LICENSE", "LICENSE.md", "LICENSE.txt"):
-        if (repo_path / name).is_file():
-            return True
-    return False
+_LICENSE_NAMES = ("LICENSE", "LICENSE.md", "LICENSE.txt")
+
+
+def has_license_file(repo: Repo) -> bool:
+    """Whether a LICENSE file is present, per the repo's cached root listing."""
+    return not repo.entries().isdisjoint(_LICENSE_NAMES)
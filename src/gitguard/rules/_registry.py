@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import functools
 import importlib
 import pkgutil
+
 from gitguard.rules import Rule
 
 # Dependency-aware ordering: foundational rules first so later rules see fixed state.
@@ -45,10 +47,15 @@ _CANONICAL_ORDER = [
     "PII_SCAN",
     "REPO_DESCRIPTION",
 ]
+_ORDER_INDEX = {rule_id: i for i, rule_id in enumerate(_CANONICAL_ORDER)}
+
 
+@functools.lru_cache(maxsize=1)
+def discover_rules() -> tuple[Rule, ...]:
+    """Import all rule modules and return instances in canonical order.
 
-def discover_rules() -> list[Rule]:
-    """Import all rule modules and return instances in canonical order."""
+    The result is computed once per process and shared, hence a tuple.
+    """
     # Import all modules in the rules package
     package = importlib.import_module("gitguard.rules")
     for importer, modname, ispkg in pkgutil.iter_modules(package.__path__):
@@ -58,30 +65,13 @@ def discover_rules() -> list[Rule]:
 
     # Collect all concrete subclasses
     instances: dict[str, Rule] = {}
-    for cls in _all_subclasses(Rule):
+    for cls in Rule._subclasses:
         if not getattr(cls, "id", None):
             continue
         instances[cls.id] = cls()
 
-    # Return in canonical order, then any extras at the end
-    ordered = []
-    for rule_id in _CANONICAL_ORDER:
-        if rule_id in instances:
-            ordered.append(instances.pop(rule_id))
-    # Append any rules not in the canonical list
-    for rule in sorted(instances.values(), key=lambda r: r.id):
-        ordered.append(rule)
-
-    return ordered
-
-
-def _all_subclasses(cls):
-    result = set()
-    work = [cls]
-    while work:
-        parent = work.pop()
-        for child in parent.__subclasses__():
-            if child not in result:
-                result.add(child)
-                work.append(child)
-    return result
+    # Canonical order first, then any rules not in the canonical list by id
+    return tuple(sorted(
+        instances.values(),
+        key=lambda r: (_ORDER_INDEX.get(r.id, len(_ORDER_INDEX)), r.id),
+    ))
@@ -2,10 +2,18 @@
 
 import json
 
-from gitguard.rules import Category, CheckResult, FixOutcome, Rule, Status
+from gitguard.rules import (
+    CHECK_PASS,
+    FIX_ALREADY_OK,
+    Category,
+    CheckResult,
+    FixOutcome,
+    Rule,
+    Status,
+)
 
 
-def _has_sandbox_enabled(repo_path) -> bool:
+def _read_sandbox_enabled(repo_path) -> bool:
     settings_file = repo_path / ".claude" / "settings.local.json"
     if not settings_file.is_file():
         return False
@@ -17,19 +25,26 @@ def _has_sandbox_enabled(repo_path) -> bool:
         return False
 
 
+def _has_sandbox_enabled(repo) -> bool:
+    """Sandbox state, parsed once per repo; check and fix share the result."""
+    if "sandbox_enabled" not in repo._cache:
+        repo._cache["sandbox_enabled"] = _read_sandbox_enabled(repo.path)
+    return repo._cache["sandbox_enabled"]
+
+
 class ClaudeSandboxRule(Rule):
     id = "CLAUDE_SANDBOX"
     name = "Sandbox must be enabled"
     category = Category.CLAUDE
 
     def check(self, repo):
-        if _has_sandbox_enabled(repo.path):
-            return CheckResult(Status.PASS)
+        if _has_sandbox_enabled(repo):
+            return CHECK_PASS
         return CheckResult(Status.FAIL, "Sandbox not enabled")
 
     def fix(self, repo, *, dry_run=False):
-        if _has_sandbox_enabled(repo.path):
-            return FixOutcome(FixOutcome.ALREADY_OK)
+        if _has_sandbox_enabled(repo):
+            return FIX_ALREADY_OK
 
         if dry_run:
             return FixOutcome(FixOutcome.FIXED, "Would enable sandbox")
@@ -54,6 +69,7 @@ class ClaudeSandboxRule(Rule):
                 }
 
             settings_file.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
-            return FixOutcome(FixOutcome.FIXED, "Enabled sandbox")
+            repo._cache.pop("sandbox_enabled", None)
+            return FixOutcome(FixOutcome.FIXED, "Enabled sandbox", verified=True)
         except Exception as e:
             return FixOutcome(FixOutcome.FAILED, str(e))
@@ -4,27 +4,37 @@ import importlib.metadata
 import json
 import re
 
-from gitguard.rules import Category, CheckResult, FixOutcome, Rule, Status
+from gitguard.rules import (
+    CHECK_PASS,
+    FIX_ALREADY_OK,
+    Category,
+    CheckResult,
+    FixOutcome,
+    Rule,
+    Status,
+)
 from gitguard.templates import load_template
 
+_RELEASE_WF_RE = re.compile(r"publish-pypi\.yml|release\.yml@main")
+
 
 class CliBuildBackendRule(Rule):
     id = "CLI_BUILD_BACKEND"
     name = "CLI projects must use hatchling"
     category = Category.PYTHON
+    required_files = ("pyproject.toml",)
 
     def applies_to(self, repo):
         return repo.is_cli
 
     def check(self, repo):
+        data = repo.pyproject_data
+        if data is None:
+            return CheckResult(Status.FAIL, f"Cannot read build-system: {repo.pyproject_error}")
         try:
-            import tomllib
-
-            with open(repo.path / "pyproject.toml", "rb") as f:
-                data = tomllib.load(f)
             backend = data.get("build-system", {}).get("build-backend", "")
             if backend == "hatchling.build":
-                return CheckResult(Status.PASS)
+                return CHECK_PASS
             return CheckResult(
                 Status.FAIL,
                 f"Build backend is {backend!r}, expected 'hatchling.build'",
@@ -37,42 +47,41 @@ class CliVersionRule(Rule):
     id = "CLI_VERSION"
     name = "CLI projects must define a version"
     category = Category.PYTHON
+    required_files = ("pyproject.toml",)
 
     def applies_to(self, repo):
         return repo.is_cli
 
     def check(self, repo):
         if repo.has_version:
-            return CheckResult(Status.PASS)
+            return CHECK_PASS
         return CheckResult(
             Status.FAIL,
             "CLI project missing version (static or dynamic)",
         )
 
 
+def _has_release_workflow(repo) -> bool:
+    return any(
+        _RELEASE_WF_RE.search(content)
+        for _, content in repo.workflow_files
+    )
+
+
 class CliReleaseWorkflowRule(Rule):
     id = "CLI_RELEASE_WORKFLOW"
     name = "CLI projects must have a release workflow with PyPI publishing"
     category = Category.CICD
+    required_files = ("pyproject.toml",)
 
     def applies_to(self, repo):
         return repo.is_cli and repo.has_version
 
     def check(self, repo):
-        wf_dir = repo.path / ".github" / "workflows"
-        if not wf_dir.is_dir():
+        if not (repo.path / ".github" / "workflows").is_dir():
             return CheckResult(Status.FAIL, "No .github/workflows directory")
-
-        for wf_file in wf_dir.iterdir():
-            if wf_file.suffix not in (".yml", ".yaml"):
-                continue
-            try:
-                content = wf_file.read_text(encoding="utf-8", errors="replace")
-                if re.search(r"publish-pypi\.yml|release\.yml@main", content):
-                    return CheckResult(Status.PASS)
-            except Exception:
-                continue
-
+        if _has_release_workflow(repo):
+            return CHECK_PASS
         return CheckResult(
             Status.FAIL,
             "No release workflow with PyPI publishing found",
@@ -82,16 +91,8 @@ class CliReleaseWorkflowRule(Rule):
         wf_dir = repo.path / ".github" / "workflows"
 
         # Re-check in case already present
-        if wf_dir.is_dir():
-            for wf_file in wf_dir.iterdir():
-                if wf_file.suffix not in (".yml", ".yaml"):
-                    continue
-                try:
-                    content = wf_file.read_text(encoding="utf-8", errors="replace")
-                    if re.search(r"publish-pypi\.yml|release\.yml@main", content):
-                        return FixOutcome(FixOutcome.ALREADY_OK)
-                except Exception:
-                    continue
+        if _has_release_workflow(repo):
+            return FIX_ALREADY_OK
 
         if dry_run:
             return FixOutcome(FixOutcome.FIXED, "Would create .github/workflows/release.yml")
@@ -109,6 +110,7 @@ class CliPypiReadyRule(Rule):
     id = "CLI_PYPI_READY"
     name = "CLI projects should have PyPI metadata"
     category = Category.PYTHON
+    required_files = ("pyproject.toml",)
 
     _REQUIRED_FIELDS = ("description", "license", "requires-python")
 
@@ -116,11 +118,10 @@ class CliPypiReadyRule(Rule):
         return repo.is_cli
 
     def check(self, repo):
+        data = repo.pyproject_data
+        if data is None:
+            return CheckResult(Status.FAIL, f"Cannot read pyproject.toml: {repo.pyproject_error}")
         try:
-            import tomllib
-
-            with open(repo.path / "pyproject.toml", "rb") as f:
-                data = tomllib.load(f)
             project = data.get("project", {})
 
             missing = []
@@ -131,7 +132,7 @@ class CliPypiReadyRule(Rule):
                 missing.append("[project.urls]")
 
             if not missing:
-                return CheckResult(Status.PASS)
+                return CHECK_PASS
             return CheckResult(
                 Status.FAIL,
                 f"Missing PyPI metadata: {', '.join(missing)}",
@@ -144,6 +145,7 @@ class CliEditableInstallRule(Rule):
     id = "CLI_EDITABLE_INSTALL"
     name = "CLI projects must be installed in editable mode"
     category = Category.PYTHON
+    required_files = ("pyproject.toml",)
 
     def applies_to(self, repo):
         return repo.is_cli
@@ -164,7 +166,7 @@ class CliEditableInstallRule(Rule):
             if direct_url_text:
                 direct_url = json.loads(direct_url_text)
                 if direct_url.get("dir_info", {}).get("editable") is True:
-                    return CheckResult(Status.PASS)
+                    return CHECK_PASS
                 return CheckResult(
                     Status.FAIL,
                     f"Package {pkg!r} is installed but not in editable mode",
@@ -1,7 +1,6 @@
 """Rule 7.3: Default branch must be 'main'."""
 
-from gitguard.git import has_branch
-from gitguard.rules import Category, CheckResult, Rule, Status
+from gitguard.rules import CHECK_PASS, Category, CheckResult, Rule, Status
 
 
 class DefaultBranchRule(Rule):
@@ -10,6 +9,6 @@ class DefaultBranchRule(Rule):
     category = Category.GIT_HYGIENE
 
     def check(self, repo):
-        if has_branch(repo.path, "main"):
-            return CheckResult(Status.PASS)
+        if "main" in repo.branches:
+            return CHECK_PASS
         return CheckResult(Status.FAIL, "No 'main' branch found")
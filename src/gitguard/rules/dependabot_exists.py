@@ -1,48 +1,59 @@
 """Rule 2.1: Dependabot must be configured."""
 
-from gitguard.rules import Category, CheckResult, FixOutcome, Rule, Status
+from gitguard.rules import (
+    CHECK_PASS,
+    FIX_ALREADY_OK,
+    Category,
+    CheckResult,
+    FixOutcome,
+    Rule,
+    Status,
+)
 
 
-def _detect_ecosystems(repo_path) -> list[str]:
+# (ecosystem, root-level manifests that indicate it), in dependabot.yml order.
+_ECOSYSTEM_MANIFESTS = (
+    ("npm", {"package.json"}),
+    ("pip", {"pyproject.toml", "requirements.txt"}),
+    ("cargo", {"Cargo.toml"}),
+    ("gomod", {"go.mod"}),
+    ("bundler", {"Gemfile"}),
+    ("composer", {"composer.json"}),
+)
+
+
+def _detect_ecosystems(repo) -> list[str]:
     ecosystems = []
-    wf_dir = repo_path / ".github" / "workflows"
-    if wf_dir.is_dir() and any(f.suffix in (".yml", ".yaml") for f in wf_dir.iterdir()):
+    if repo.has_workflows:
         ecosystems.append("github-actions")
-    if (repo_path / "package.json").is_file():
-        ecosystems.append("npm")
-    if (repo_path / "pyproject.toml").is_file() or (repo_path / "requirements.txt").is_file():
-        ecosystems.append("pip")
-    if (repo_path / "Cargo.toml").is_file():
-        ecosystems.append("cargo")
-    if (repo_path / "go.mod").is_file():
-        ecosystems.append("gomod")
-    if (repo_path / "Gemfile").is_file():
-        ecosystems.append("bundler")
-    if (repo_path / "composer.json").is_file():
-        ecosystems.append("composer")
+    names = repo.entries()
+    for eco, manifests in _ECOSYSTEM_MANIFESTS:
+        if not names.isdisjoint(manifests):
+            ecosystems.append(eco)
     if not ecosystems:
         ecosystems.append("github-actions")
     return ecosystems
 
 
+def _has_dependabot_config(repo) -> bool:
+    return not repo.entries(".github").isdisjoint(("dependabot.yml", "dependabot.yaml"))
+
+
 class DependabotExistsRule(Rule):
     id = "DEPENDABOT_EXISTS"
     name = "Dependabot must be configured"
     category = Category.DEPENDENCY_MANAGEMENT
 
     def check(self, repo):
-        if (repo.path / ".github" / "dependabot.yml").is_file():
-            return CheckResult(Status.PASS)
-        if (repo.path / ".github" / "dependabot.yaml").is_file():
-            return CheckResult(Status.PASS)
+        if _has_dependabot_config(repo):
+            return CHECK_PASS
         return CheckResult(Status.FAIL, "No .github/dependabot.yml")
 
     def fix(self, repo, *, dry_run=False):
-        if (repo.path / ".github" / "dependabot.yml").is_file() or \
-           (repo.path / ".github" / "dependabot.yaml").is_file():
-            return FixOutcome(FixOutcome.ALREADY_OK)
+        if _has_dependabot_config(repo):
+            return FIX_ALREADY_OK
 
-        ecosystems = _detect_ecosystems(repo.path)
+        ecosystems = _detect_ecosystems(repo)
 
         if dry_run:
             return FixOutcome(FixOutcome.FIXED, f"Would create dependabot.yml ({', '.join(ecosystems)})")
@@ -65,6 +76,8 @@ class DependabotExistsRule(Rule):
             gh_dir = repo.path / ".github"
             gh_dir.mkdir(parents=True, exist_ok=True)
             (gh_dir / "dependabot.yml").write_text(content, encoding="utf-8")
-            return FixOutcome(FixOutcome.FIXED, f"Created dependabot.yml ({', '.join(ecosystems)})")
+            # The cached .github listing no longer matches the tree.
+            repo.invalidate()
+            return FixOutcome(FixOutcome.FIXED, f"Created dependabot.yml ({', '.join(ecosystems)})", verified=True)
         except Exception as e:
             return FixOutcome(FixOutcome.FAILED, str(e))
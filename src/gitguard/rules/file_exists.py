@@ -1,12 +1,21 @@
 """File existence rules (LICENSE, CLAUDE.md)."""
 
-import subprocess
 from datetime import datetime
 
-from gitguard.rules import Category, CheckResult, FixOutcome, Rule, Status
+from gitguard.rules import (
+    CHECK_PASS,
+    FIX_ALREADY_OK,
+    Category,
+    CheckResult,
+    FixOutcome,
+    Rule,
+    Status,
+)
 from gitguard.rules._helpers import has_license_file
 from gitguard.templates import load_template
 
+_CURRENT_YEAR = str(datetime.now().year)
+
 
 class LicenseExistsRule(Rule):
     id = "LICENSE_EXISTS"
@@ -14,32 +23,25 @@ class LicenseExistsRule(Rule):
     category = Category.REPO_STRUCTURE
 
     def check(self, repo):
-        if has_license_file(repo.path):
-            return CheckResult(Status.PASS)
+        if has_license_file(repo):
+            return CHECK_PASS
         return CheckResult(Status.FAIL, "No LICENSE file found")
 
     def fix(self, repo, *, dry_run=False):
-        if has_license_file(repo.path):
-            return FixOutcome(FixOutcome.ALREADY_OK)
+        if has_license_file(repo):
+            return FIX_ALREADY_OK
 
         if dry_run:
             return FixOutcome(FixOutcome.FIXED, "Would create LICENSE")
 
         try:
             template = load_template("LICENSE")
-            try:
-                r = subprocess.run(
-                    ["git", "-C", str(repo.path), "config", "user.name"],
-                    capture_output=True, text=True, timeout=5,
-                )
-                author = r.stdout.strip() or "Author"
-            except Exception:
-                author = "Author"
-
-            year = str(datetime.now().year)
+            author = repo.git_user_name
+            year = _CURRENT_YEAR
             content = template.replace("[year]", year).replace("[fullname]", author)
             (repo.path / "LICENSE").write_text(content, encoding="utf-8")
-            return FixOutcome(FixOutcome.FIXED, f"Created LICENSE (MIT, {year}, {author})")
+            repo.invalidate()
+            return FixOutcome(FixOutcome.FIXED, f"Created LICENSE (MIT, {year}, {author})", verified=True)
         except Exception as e:
             return FixOutcome(FixOutcome.FAILED, str(e))
 
@@ -51,12 +53,12 @@ class ClaudeMdExistsRule(Rule):
 
     def check(self, repo):
         if (repo.path / "CLAUDE.md").is_file():
-            return CheckResult(Status.PASS)
+            return CHECK_PASS
         return CheckResult(Status.FAIL, "CLAUDE.md not found")
 
     def fix(self, repo, *, dry_run=False):
         if (repo.path / "CLAUDE.md").is_file():
-            return FixOutcome(FixOutcome.ALREADY_OK)
+            return FIX_ALREADY_OK
 
         if dry_run:
             return FixOutcome(FixOutcome.FIXED, "Would create CLAUDE.md")
@@ -65,6 +67,6 @@ class ClaudeMdExistsRule(Rule):
             template = load_template("CLAUDE.md")
             content = template.replace("[project-name]", repo.name)
             (repo.path / "CLAUDE.md").write_text(content, encoding="utf-8")
-            return FixOutcome(FixOutcome.FIXED, "Created CLAUDE.md")
+            return FixOutcome(FixOutcome.FIXED, "Created CLAUDE.md", verified=True)
         except Exception as e:
             return FixOutcome(FixOutcome.FAILED, str(e))
@@ -1,22 +1,27 @@
 """Gitignore rules (existence and completeness)."""
 
+import functools
+from collections.abc import Sequence
 from pathlib import Path
 
-from gitguard.rules import Category, CheckResult, FixOutcome, Rule, Status
+from gitguard.rules import (
+    CHECK_PASS,
+    FIX_ALREADY_OK,
+    Category,
+    CheckResult,
+    FixOutcome,
+    Rule,
+    Status,
+)
 from gitguard.rules._helpers import ESSENTIAL_GITIGNORE
 
 _MANAGED_HEADER = "# Managed by tsilva/.github"
 _MANAGED_SUBHEADER = "# Do not remove - synced automatically"
 
-# Load full rules from gitignore.global if available
-_GITIGNORE_GLOBAL: list[str] | None = None
-
-
-def _load_gitignore_global() -> list[str]:
-    global _GITIGNORE_GLOBAL
-    if _GITIGNORE_GLOBAL is not None:
-        return _GITIGNORE_GLOBAL
 
+@functools.cache
+def _load_gitignore_global() -> tuple[str, ...]:
+    """Full rules from gitignore.global if available, read once per process."""
     candidates = [
         Path(__file__).resolve().parents[3] / "gitignore.global",
     ]
@@ -27,11 +32,12 @@ def _load_gitignore_global() -> list[str]:
                 stripped = line.strip()
                 if stripped and not stripped.startswith("#"):
                     rules.append(stripped)
-            _GITIGNORE_GLOBAL = rules
-            return rules
+            return tuple(rules)
+    return ()
+
 
-    _GITIGNORE_GLOBAL = []
-    return []
+def _normalize(pattern: str) -> str:
+    return pattern.strip().strip("/").lower()
 
 
 def _parse_managed_rules(content: str) -> list[str]:
@@ -67,7 +73,7 @@ def _strip_managed_blocks(content: str) -> str:
     return "\n".join(lines) + "\n" if lines else ""
 
 
-def _build_managed_block(rules: list[str]) -> str:
+def _build_managed_block(rules: Sequence[str]) -> str:
     """Build a managed block string from rules."""
     return f"{_MANAGED_HEADER}\n{_MANAGED_SUBHEADER}\n" + "\n".join(rules) + "\n"
 
@@ -78,18 +84,14 @@ class GitignoreRule(Rule):
     category = Category.REPO_STRUCTURE
 
     def check(self, repo):
-        gitignore = repo.path / ".gitignore"
-        if not gitignore.is_file():
+        content = repo.gitignore_text
+        if content is None:
             return CheckResult(Status.FAIL, ".gitignore not found")
 
-        content = gitignore.read_text(encoding="utf-8", errors="replace")
-        content_lower = content.lower()
-
-        # Check essential patterns are present
-        missing = []
-        for pattern in ESSENTIAL_GITIGNORE:
-            if pattern.rstrip("/").lower() not in content_lower:
-                missing.append(pattern)
+        # Check essential patterns are present, as whole lines (ignoring case
+        # and leading/trailing slashes)
+        lines = {_normalize(line) for line in content.splitlines()}
+        missing = [p for p in ESSENTIAL_GITIGNORE if _normalize(p) not in lines]
         if missing:
             return CheckResult(Status.FAIL, f"Missing {len(missing)} patterns: {' '.join(missing)}")
 
@@ -108,14 +110,15 @@ class GitignoreRule(Rule):
                     parts.append(f"missing: {' '.join(added)}")
                 return CheckResult(Status.FAIL, f"Managed block out of sync ({'; '.join(parts)})")
 
-        return CheckResult(Status.PASS)
+        return CHECK_PASS
 
     def fix(self, repo, *, dry_run=False):
         gitignore = repo.path / ".gitignore"
         all_rules = _load_gitignore_global() or ESSENTIAL_GITIGNORE
         managed_block = _build_managed_block(all_rules)
 
-        if not gitignore.is_file():
+        content = repo.gitignore_text
+        if content is None:
             if dry_run:
                 return FixOutcome(FixOutcome.FIXED, "Would create .gitignore with managed patterns")
             try:
@@ -124,15 +127,15 @@ class GitignoreRule(Rule):
             except Exception as e:
                 return FixOutcome(FixOutcome.FAILED, str(e))
 
-        content = gitignore.read_text(encoding="utf-8", errors="replace")
         managed_rules = _parse_managed_rules(content)
+        managed, expected = set(managed_rules), set(all_rules)
 
-        if set(managed_rules) == set(all_rules) and managed_rules:
-            return FixOutcome(FixOutcome.ALREADY_OK)
+        if managed == expected and managed_rules:
+            return FIX_ALREADY_OK
 
         if dry_run:
-            stale = set(managed_rules) - set(all_rules)
-            new = set(all_rules) - set(managed_rules)
+            stale = managed - expected
+            new = expected - managed
             parts = []
             if stale:
                 parts.append(f"remove {len(stale)} stale")
@@ -1,6 +1,6 @@
 """Rule 1.5: Logo must exist."""
 
-from gitguard.rules import Category, CheckResult, Rule, Status
+from gitguard.rules import CHECK_PASS, Category, CheckResult, Rule, Status
 
 LOGO_LOCATIONS = [
     "logo.png", "logo.svg", "logo.jpg",
@@ -10,13 +10,21 @@ LOGO_LOCATIONS = [
 ]
 
 
+def find_logo(repo) -> str | None:
+    """First of LOGO_LOCATIONS present, from the repo's cached directory listings."""
+    for loc in LOGO_LOCATIONS:
+        subdir, _, name = loc.rpartition("/")
+        if name in repo.entries(subdir):
+            return loc
+    return None
+
+
 class LogoExistsRule(Rule):
     id = "LOGO_EXISTS"
     name = "Logo must exist"
     category = Category.REPO_STRUCTURE
 
     def check(self, repo):
-        for loc in LOGO_LOCATIONS:
-            if (repo.path / loc).is_file():
-                return CheckResult(Status.PASS)
+        if find_logo(repo):
+            return CHECK_PASS
         return CheckResult(Status.FAIL, "No logo found in standard locations")
@@ -1,7 +1,6 @@
 """Rule 7.1: No pending commits."""
 
-from gitguard.git import status_porcelain, unpushed_commits
-from gitguard.rules import Category, CheckResult, Rule, Status
+from gitguard.rules import CHECK_PASS, Category, CheckResult, Rule, Status
 
 
 class PendingCommitsRule(Rule):
@@ -11,17 +10,14 @@ class PendingCommitsRule(Rule):
 
     def check(self, repo):
         issues = []
+        snap = repo.git_snapshot
 
-        porcelain = status_porcelain(repo.path)
-        if porcelain:
-            count = len(porcelain.splitlines())
-            issues.append(f"{count} uncommitted change(s)")
+        if snap.changes:
+            issues.append(f"{snap.changes} uncommitted change(s)")
 
-        unpushed = unpushed_commits(repo.path)
-        if unpushed:
-            count = len(unpushed.splitlines())
-            issues.append(f"{count} unpushed commit(s)")
+        if snap.ahead:
+            issues.append(f"{snap.ahead} unpushed commit(s)")
 
         if not issues:
-            return CheckResult(Status.PASS)
+            return CHECK_PASS
         return CheckResult(Status.FAIL, "; ".join(issues))
@@ -1,6 +1,14 @@
 """Rule 6.2: Pre-commit hooks for secret scanning."""
 
-from gitguard.rules import Category, CheckResult, FixOutcome, Rule, Status
+from gitguard.rules import (
+    CHECK_PASS,
+    FIX_ALREADY_OK,
+    Category,
+    CheckResult,
+    FixOutcome,
+    Rule,
+    Status,
+)
 from gitguard.templates import load_template
 
 
@@ -19,7 +27,7 @@ class PrecommitGitleaksRule(Rule):
 
         content = config.read_text(encoding="utf-8", errors="replace")
         if "tsilva/.github" in content:
-            return CheckResult(Status.PASS)
+            return CHECK_PASS
         return CheckResult(Status.FAIL, ".pre-commit-config.yaml missing gitleaks hook")
 
     def fix(self, repo, *, dry_run=False):
@@ -28,7 +36,7 @@ class PrecommitGitleaksRule(Rule):
         if config.is_file():
             content = config.read_text(encoding="utf-8", errors="replace")
             if "tsilva/.github" in content:
-                return FixOutcome(FixOutcome.ALREADY_OK)
+                return FIX_ALREADY_OK
 
             if dry_run:
                 return FixOutcome(FixOutcome.FIXED, "Would append gitleaks hook")
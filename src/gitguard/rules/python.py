@@ -1,6 +1,6 @@
 """Python project rules (pyproject.toml, minimum version)."""
 
-from gitguard.rules import Category, CheckResult, Rule, Status
+from gitguard.rules import CHECK_PASS, Category, CheckResult, Rule, Status
 
 
 class PythonPyprojectRule(Rule):
@@ -13,7 +13,7 @@ class PythonPyprojectRule(Rule):
 
     def check(self, repo):
         if repo.has_pyproject:
-            return CheckResult(Status.PASS)
+            return CHECK_PASS
         return CheckResult(Status.FAIL, "Python project missing pyproject.toml")
 
 
@@ -21,18 +21,16 @@ class PythonMinVersionRule(Rule):
     id = "PYTHON_MIN_VERSION"
     name = "Must specify minimum Python version"
     category = Category.PYTHON
+    required_files = ("pyproject.toml",)
 
     def applies_to(self, repo):
         return repo.has_pyproject
 
     def check(self, repo):
         try:
-            import tomllib
-            with open(repo.path / "pyproject.toml", "rb") as f:
-                data = tomllib.load(f)
-            rp = data.get("project", {}).get("requires-python", "")
+            rp = (repo.pyproject_data or {}).get("project", {}).get("requires-python", "")
             if rp:
-                return CheckResult(Status.PASS)
+                return CHECK_PASS
             return CheckResult(Status.FAIL, "pyproject.toml missing requires-python")
         except Exception:
             return CheckResult(Status.FAIL, "pyproject.toml missing requires-python")
@@ -2,16 +2,23 @@
 
 import re
 
-from gitguard.rules import Category, CheckResult, FixOutcome, Rule, Status
+from gitguard.rules import (
+    CHECK_PASS,
+    FIX_ALREADY_OK,
+    Category,
+    CheckResult,
+    FixOutcome,
+    Rule,
+    Status,
+)
 from gitguard.rules._helpers import has_license_file
 
+_LICENSE_REF_RE = re.compile(r"## license|# license|mit license|\[mit\]", re.IGNORECASE)
+_CI_BADGE_RE = re.compile(r"actions/workflows/.*badge|shields\.io.*workflow|!\[.*\]\(.*actions/workflows")
 
-def _readme_has_license_ref(readme_path) -> bool:
-    try:
-        content = readme_path.read_text(encoding="utf-8", errors="replace").lower()
-        return bool(re.search(r"## license|# license|mit license|\[mit\]", content))
-    except Exception:
-        return False
+
+def _readme_has_license_ref(content: str) -> bool:
+    return _LICENSE_REF_RE.search(content) is not None
 
 
 class ReadmeLicenseRule(Rule):
@@ -20,26 +27,27 @@ class ReadmeLicenseRule(Rule):
     category = Category.REPO_STRUCTURE
 
     def check(self, repo):
-        readme = repo.path / "README.md"
-        if not readme.is_file():
+        content = repo.readme_text
+        if content is None:
             return CheckResult(Status.FAIL, "README.md does not exist")
-        if _readme_has_license_ref(readme):
-            return CheckResult(Status.PASS)
+        if _readme_has_license_ref(content):
+            return CHECK_PASS
         return CheckResult(Status.FAIL, "README missing license reference")
 
     def fix(self, repo, *, dry_run=False):
-        readme = repo.path / "README.md"
-        if not readme.is_file():
+        content = repo.readme_text
+        if content is None:
             return FixOutcome(FixOutcome.SKIPPED, "No README.md")
-        if not has_license_file(repo.path):
+        if not has_license_file(repo):
             return FixOutcome(FixOutcome.SKIPPED, "No LICENSE file")
-        if _readme_has_license_ref(readme):
-            return FixOutcome(FixOutcome.ALREADY_OK)
+        if _readme_has_license_ref(content):
+            return FIX_ALREADY_OK
         if dry_run:
             return FixOutcome(FixOutcome.FIXED, "Would append license section")
         try:
-            with open(readme, "a", encoding="utf-8") as f:
+            with open(repo.path / "README.md", "a", encoding="utf-8") as f:
                 f.write("\n## License\n\nMIT\n")
+            repo.invalidate()
             return FixOutcome(FixOutcome.FIXED, "Appended license section")
         except Exception as e:
             return FixOutcome(FixOutcome.FAILED, str(e))
@@ -54,11 +62,10 @@ class ReadmeCiBadgeRule(Rule):
         return repo.has_ci_workflow
 
     def check(self, repo):
-        readme = repo.path / "README.md"
-        if not readme.is_file():
+        content = repo.readme_text
+        if content is None:
             return CheckResult(Status.FAIL, "README.md does not exist")
 
-        content = readme.read_text(encoding="utf-8", errors="replace")
-        if re.search(r"actions/workflows/.*badge|shields\.io.*workflow|!\[.*\]\(.*actions/workflows", content):
-            return CheckResult(Status.PASS)
+        if _CI_BADGE_RE.search(content):
+            return CHECK_PASS
         return CheckResult(Status.FAIL, "README missing CI badge")
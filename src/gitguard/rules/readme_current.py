@@ -2,7 +2,7 @@
 
 import re
 
-from gitguard.rules import Category, CheckResult, Rule, Status
+from gitguard.rules import CHECK_PASS, Category, CheckResult, Rule, Status
 
 _PLACEHOLDERS = ["TODO", "FIXME", "Coming soon", "Work in progress", "Under construction", "[Insert", "Lorem ipsum"]
 
@@ -13,11 +13,10 @@ class ReadmeCurrentRule(Rule):
     category = Category.REPO_STRUCTURE
 
     def check(self, repo):
-        readme = repo.path / "README.md"
-        if not readme.is_file():
+        content = repo.readme_text
+        if content is None:
             return CheckResult(Status.FAIL, "README.md does not exist")
 
-        content = readme.read_text(encoding="utf-8", errors="replace")
         issues = []
 
         for placeholder in _PLACEHOLDERS:
@@ -35,5 +34,5 @@ class ReadmeCurrentRule(Rule):
             issues.append("Missing installation/usage sections")
 
         if not issues:
-            return CheckResult(Status.PASS)
+            return CHECK_PASS
         return CheckResult(Status.FAIL, "; ".join(issues))
@@ -1,6 +1,6 @@
 """Rule 1.1: README must exist."""
 
-from gitguard.rules import Category, CheckResult, Rule, Status
+from gitguard.rules import CHECK_PASS, Category, CheckResult, Rule, Status
 
 
 class ReadmeExistsRule(Rule):
@@ -10,5 +10,5 @@ class ReadmeExistsRule(Rule):
 
     def check(self, repo):
         if (repo.path / "README.md").is_file():
-            return CheckResult(Status.PASS)
+            return CHECK_PASS
         return CheckResult(Status.FAIL, "README.md not found")
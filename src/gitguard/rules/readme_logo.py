@@ -2,15 +2,27 @@
 
 import re
 
-from gitguard.rules import Category, CheckResult, FixOutcome, Rule, Status
-from gitguard.rules.logo_exists import LOGO_LOCATIONS
+from gitguard.rules import (
+    CHECK_PASS,
+    FIX_ALREADY_OK,
+    Category,
+    CheckResult,
+    FixOutcome,
+    Rule,
+    Status,
+)
+from gitguard.rules.logo_exists import find_logo
 
-_LOGO_PATTERN_MD = re.compile(r'!\[.*\]\(\.?/?((assets|images|\.github)/)?logo\.', re.IGNORECASE)
-_LOGO_PATTERN_HTML = re.compile(r'<img[^>]+src=.\.?/?((assets|images|\.github)/)?logo\.', re.IGNORECASE)
+# Markdown image or HTML <img> pointing at logo.* (optionally under assets/,
+# images/ or .github/), matched in a single pass.
+_LOGO_PATTERN = re.compile(
+    r'(?:!\[.*\]\(|<img[^>]+src=.)\.?/?(?:(?:assets|images|\.github)/)?logo\.',
+    re.IGNORECASE,
+)
 
 
 def _readme_has_logo_ref(content: str) -> bool:
-    return bool(_LOGO_PATTERN_MD.search(content) or _LOGO_PATTERN_HTML.search(content))
+    return _LOGO_PATTERN.search(content) is not None
 
 
 class ReadmeLogoRule(Rule):
@@ -19,49 +31,43 @@ class ReadmeLogoRule(Rule):
     category = Category.REPO_STRUCTURE
 
     def check(self, repo):
-        readme = repo.path / "README.md"
-        if not readme.is_file():
+        content = repo.readme_text
+        if content is None:
             return CheckResult(Status.FAIL, "README.md does not exist")
-        content = readme.read_text(encoding="utf-8", errors="replace")
         if _readme_has_logo_ref(content):
-            return CheckResult(Status.PASS)
+            return CHECK_PASS
         return CheckResult(Status.FAIL, "README does not reference logo")
 
     def fix(self, repo, *, dry_run=False):
-        readme = repo.path / "README.md"
-        if not readme.is_file():
+        content = repo.readme_text
+        if content is None:
             return FixOutcome(FixOutcome.SKIPPED, "No README.md")
 
-        # Find logo file
-        logo_path = None
-        for loc in LOGO_LOCATIONS:
-            if (repo.path / loc).is_file():
-                logo_path = loc
-                break
+        logo_path = find_logo(repo)
         if not logo_path:
             return FixOutcome(FixOutcome.SKIPPED, "No logo file found")
 
-        content = readme.read_text(encoding="utf-8", errors="replace")
         if _readme_has_logo_ref(content):
-            return FixOutcome(FixOutcome.ALREADY_OK)
+            return FIX_ALREADY_OK
 
         if dry_run:
             return FixOutcome(FixOutcome.FIXED, f"Would insert logo reference -> {logo_path}")
 
         logo_block = f'\n<p align="center">\n  <img src="{logo_path}" alt="{repo.name} logo" width="200">\n</p>\n'
 
-        lines = content.splitlines(keepends=True)
-        # Find first heading and insert after it
-        for i, line in enumerate(lines):
-            if line.startswith("# "):
-                lines.insert(i + 1, logo_block)
-                break
-        else:
+        # Splice in right after the first heading line
+        heading = 0 if content.startswith("# ") else content.find("\n# ")
+        if heading == -1:
             # No heading — prepend
-            lines.insert(0, logo_block + "\n")
+            new_content = logo_block + "\n" + content
+        else:
+            end = content.find("\n", heading + 1)
+            end = len(content) if end == -1 else end + 1
+            new_content = content[:end] + logo_block + content[end:]
 
         try:
-            readme.write_text("".join(lines), encoding="utf-8")
+            (repo.path / "README.md").write_text(new_content, encoding="utf-8")
+            repo.invalidate()
             return FixOutcome(FixOutcome.FIXED, f"Inserted logo reference -> {logo_path}")
         except Exception as e:
             return FixOutcome(FixOutcome.FAILED, str(e))
@@ -1,8 +1,24 @@
 """Rule 1.12: GitHub description must match README tagline."""
 
 from gitguard.github import get_repo_description, gh_authenticated, set_repo_description
-from gitguard.rules import Category, CheckResult, FixOutcome, Rule, Status
-from gitguard.tagline import extract_tagline
+from gitguard.rules import (
+    CHECK_PASS,
+    CHECK_SKIP,
+    FIX_ALREADY_OK,
+    Category,
+    CheckResult,
+    FixOutcome,
+    Rule,
+    Status,
+)
+from gitguard.tagline import tagline_from_text
+
+
+def _github_description(repo) -> str:
+    """GitHub description, from the batched prefetch when available."""
+    if "description" not in repo._prefetch:
+        repo._prefetch["description"] = get_repo_description(repo.github_repo)
+    return repo._prefetch["description"]
 
 
 class RepoDescriptionRule(Rule):
@@ -12,25 +28,23 @@ class RepoDescriptionRule(Rule):
 
     def check(self, repo):
         if not gh_authenticated():
-            return CheckResult(Status.SKIP)
+            return CHECK_SKIP
 
         github_repo = repo.github_repo
         if not github_repo:
-            return CheckResult(Status.SKIP)
+            return CHECK_SKIP
 
-        readme = repo.path / "README.md"
-        if not readme.is_file():
-            return CheckResult(Status.SKIP)
+        readme = repo.readme_text
+        if readme is None:
+            return CHECK_SKIP
 
-        tagline = extract_tagline(str(readme))
+        tagline = tagline_from_text(readme)
         if not tagline:
-            return CheckResult(Status.SKIP)
+            return CHECK_SKIP
 
-        github_desc = repo._prefetch.get("description")
-        if github_desc is None:
-            github_desc = get_repo_description(github_repo)
+        github_desc = _github_description(repo)
         if tagline == github_desc:
-            return CheckResult(Status.PASS)
+            return CHECK_PASS
         return CheckResult(Status.FAIL, "Description mismatch (GitHub vs README tagline)")
 
     def fix(self, repo, *, dry_run=False):
@@ -41,23 +55,23 @@ class RepoDescriptionRule(Rule):
         if not github_repo:
             return FixOutcome(FixOutcome.SKIPPED, "No GitHub remote")
 
-        readme = repo.path / "README.md"
-        if not readme.is_file():
+        readme = repo.readme_text
+        if readme is None:
             return FixOutcome(FixOutcome.SKIPPED, "No README.md")
 
-        tagline = extract_tagline(str(readme))
+        tagline = tagline_from_text(readme)
         if not tagline:
             return FixOutcome(FixOutcome.SKIPPED, "No tagline found")
 
-        github_desc = repo._prefetch.get("description")
-        if github_desc is None:
-            github_desc = get_repo_description(github_repo)
+        github_desc = _github_description(repo)
         if tagline == github_desc:
-            return FixOutcome(FixOutcome.ALREADY_OK)
+            return FIX_ALREADY_OK
 
         if dry_run:
             return FixOutcome(FixOutcome.FIXED, f"Would update description to: {tagline}")
 
         if set_repo_description(github_repo, tagline):
+            # Keep the prefetched value current so the re-check sees the edit.
+            repo._prefetch["description"] = tagline
             return FixOutcome(FixOutcome.FIXED, f"Updated description: {tagline}")
         return FixOutcome(FixOutcome.FAILED, "gh repo edit failed")
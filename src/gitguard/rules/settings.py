@@ -2,22 +2,43 @@
 
 import json
 
-from gitguard.rules import Category, CheckResult, FixOutcome, Rule, Status
+from gitguard.rules import (
+    CHECK_PASS,
+    CHECK_SKIP,
+    FIX_ALREADY_OK,
+    Category,
+    CheckResult,
+    FixOutcome,
+    Rule,
+    Status,
+)
 from gitguard.settings_optimizer import SettingsOptimizer
 
 
-def _check_settings(repo, mode, fail_message):
-    settings_file = repo.path / ".claude" / "settings.local.json"
-    if not settings_file.is_file():
-        return CheckResult(Status.SKIP), None
+def _analyze_settings(repo):
+    """(optimizer, grouped issues) for the repo's settings, or None if absent.
+
+    Loaded and analyzed once per repo; both settings rules read the result.
+    """
+    if "settings_analysis" not in repo._cache:
+        analysis = None
+        settings_file = repo.path / ".claude" / "settings.local.json"
+        if settings_file.is_file():
+            optimizer = SettingsOptimizer(project_path=settings_file)
+            if optimizer.load_settings():
+                analysis = (optimizer, optimizer.analyze())
+        repo._cache["settings_analysis"] = analysis
+    return repo._cache["settings_analysis"]
 
-    optimizer = SettingsOptimizer(project_path=settings_file)
-    if not optimizer.load_settings():
-        return CheckResult(Status.SKIP), None
 
-    grouped = optimizer.analyze()
+def _check_settings(repo, mode, fail_message):
+    analysis = _analyze_settings(repo)
+    if analysis is None:
+        return CHECK_SKIP, None
+
+    optimizer, grouped = analysis
     if optimizer.check(mode, grouped):
-        return CheckResult(Status.PASS), None
+        return CHECK_PASS, None
     return CheckResult(Status.FAIL, fail_message), (optimizer, grouped)
 
 
@@ -25,6 +46,7 @@ class SettingsDangerousRule(Rule):
     id = "SETTINGS_DANGEROUS"
     name = "No dangerous permission patterns"
     category = Category.CLAUDE
+    required_files = (".claude",)
 
     def check(self, repo):
         result, _ = _check_settings(repo, "dangerous", "Dangerous permission patterns detected")
@@ -41,16 +63,15 @@ class SettingsDangerousRule(Rule):
             return FixOutcome(FixOutcome.SKIPPED, "Cannot parse settings.local.json")
 
         allow = data.get("permissions", {}).get("allow", [])
-        cleaned = [p for p in allow if p not in SettingsOptimizer.DANGEROUS_PATTERNS]
+        removed = SettingsOptimizer.DANGEROUS_PATTERNS.intersection(allow)
 
-        if len(cleaned) == len(allow):
-            return FixOutcome(FixOutcome.ALREADY_OK)
+        if not removed:
+            return FIX_ALREADY_OK
 
         if dry_run:
-            removed = set(allow) - set(cleaned)
             return FixOutcome(FixOutcome.FIXED, f"Would remove: {', '.join(sorted(removed))}")
 
-        data.setdefault("permissions", {})["allow"] = cleaned
+        data.setdefault("permissions", {})["allow"] = [p for p in allow if p not in removed]
         settings_file.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
         return FixOutcome(FixOutcome.FIXED, "Removed dangerous patterns")
 
@@ -59,6 +80,7 @@ class SettingsCleanRule(Rule):
     id = "SETTINGS_CLEAN"
     name = "Settings must be clean"
     category = Category.CLAUDE
+    required_files = (".claude",)
 
     def check(self, repo):
         result, _ = _check_settings(repo, "clean", "Redundant permissions or unmigrated WebFetch domains")
@@ -69,7 +91,7 @@ class SettingsCleanRule(Rule):
         if result.status == Status.SKIP:
             return FixOutcome(FixOutcome.SKIPPED, "No settings.local.json or no permissions")
         if result.status == Status.PASS:
-            return FixOutcome(FixOutcome.ALREADY_OK)
+            return FIX_ALREADY_OK
 
         if dry_run:
             return FixOutcome(FixOutcome.FIXED, "Would optimize settings")
@@ -2,10 +2,19 @@
 
 import time
 
-from gitguard.git import branch_ages, merged_branches
-from gitguard.rules import Category, CheckResult, Rule, Status
+from gitguard.git import merged_branches
+from gitguard.rules import CHECK_PASS, Category, CheckResult, Rule, Status
 
 _90_DAYS = 90 * 86400
+# Branch names listed per issue; the rest are summarized as "+N more".
+_MAX_NAMES = 10
+
+
+def _format_names(names: list[str]) -> str:
+    shown = ", ".join(names[:_MAX_NAMES])
+    if len(names) > _MAX_NAMES:
+        shown += f", +{len(names) - _MAX_NAMES} more"
+    return shown
 
 
 class StaleBranchesRule(Rule):
@@ -15,24 +24,24 @@ class StaleBranchesRule(Rule):
 
     def check(self, repo):
         issues = []
+        branches = repo.git_snapshot.branches
+
+        # Most repos only have main/master; then nothing can be merged or stale.
+        if all(name in ("main", "master") for name, _ in branches):
+            return CHECK_PASS
 
         merged = merged_branches(repo.path)
         if merged:
-            names = ", ".join(merged)
-            issues.append(f"{len(merged)} merged branch(es): {names}")
+            issues.append(f"{len(merged)} merged branch(es): {_format_names(merged)}")
 
         cutoff = int(time.time()) - _90_DAYS
-        stale = []
-        for branch, epoch in branch_ages(repo.path):
-            if branch in ("main", "master"):
-                continue
-            if epoch < cutoff:
-                stale.append(branch)
-
+        stale = [
+            branch for branch, epoch in branches
+            if epoch < cutoff and branch not in ("main", "master")
+        ]
         if stale:
-            names = ", ".join(stale)
-            issues.append(f"{len(stale)} stale branch(es) (>90d): {names}")
+            issues.append(f"{len(stale)} stale branch(es) (>90d): {_format_names(stale)}")
 
         if not issues:
-            return CheckResult(Status.PASS)
+            return CHECK_PASS
         return CheckResult(Status.FAIL, "; ".join(issues))
@@ -1,7 +1,15 @@
 """Rule 1.11: No tracked files matching gitignore."""
 
-from gitguard.git import run_git, tracked_ignored_files
-from gitguard.rules import Category, CheckResult, FixOutcome, Rule, Status
+from gitguard.git import run_git, tracked_ignored_count, tracked_ignored_files
+from gitguard.rules import (
+    CHECK_PASS,
+    FIX_ALREADY_OK,
+    Category,
+    CheckResult,
+    FixOutcome,
+    Rule,
+    Status,
+)
 
 
 class TrackedIgnoredRule(Rule):
@@ -10,20 +18,20 @@ class TrackedIgnoredRule(Rule):
     category = Category.REPO_STRUCTURE
 
     def check(self, repo):
-        files = tracked_ignored_files(repo.path)
-        if not files:
-            return CheckResult(Status.PASS)
-        return CheckResult(Status.FAIL, f"{len(files)} tracked file(s) match gitignore")
+        count = tracked_ignored_count(repo.path)
+        if not count:
+            return CHECK_PASS
+        return CheckResult(Status.FAIL, f"{count} tracked file(s) match gitignore")
 
     def fix(self, repo, *, dry_run=False):
         files = tracked_ignored_files(repo.path)
         if not files:
-            return FixOutcome(FixOutcome.ALREADY_OK)
+            return FIX_ALREADY_OK
 
         if dry_run:
             return FixOutcome(FixOutcome.FIXED, f"Would untrack {len(files)} file(s)")
 
         r = run_git(repo.path, "rm", "--cached", "--", *files)
         if r.returncode != 0:
-            return FixOutcome(FixOutcome.FAILED, r.stderr.strip())
+            return FixOutcome(FixOutcome.FAILED, r.stderr.decode("utf-8", "replace").strip())
         return FixOutcome(FixOutcome.FIXED, f"Untracked {len(files)} file(s)")
@@ -2,14 +2,18 @@
 
 import re
 
-from gitguard.rules import Category, CheckResult, Rule, Status
+from gitguard.rules import CHECK_PASS, Category, CheckResult, Rule, Status
 
 
 class _WorkflowSearchBase(Rule):
     """Search .github/workflows/*.yml for a regex pattern. No id — skipped by registry."""
 
-    _pattern: str
+    # None when the hints alone define a match (pure-literal searches).
+    _pattern: re.Pattern[str] | None
     _fail_message: str
+    # Literals of which every match contains at least one; files with none
+    # of them are skipped without running the regex.
+    _hints: tuple[str, ...] = ()
 
     def applies_to(self, repo):
         check = getattr(self, "_applies_check", None)
@@ -18,30 +22,28 @@ class _WorkflowSearchBase(Rule):
         return True
 
     def check(self, repo):
-        wf_dir = repo.path / ".github" / "workflows"
-        if not wf_dir.is_dir():
-            return CheckResult(Status.FAIL, self._fail_message)
-
-        for wf_file in wf_dir.iterdir():
-            if wf_file.suffix not in (".yml", ".yaml"):
-                continue
-            try:
-                content = wf_file.read_text(encoding="utf-8", errors="replace")
-                if re.search(self._pattern, content):
-                    return CheckResult(Status.PASS)
-            except Exception:
+        hints = self._hints
+        for _, content in repo.workflow_files:
+            if hints and not any(h in content for h in hints):
                 continue
-
+            if self._pattern is None or self._pattern.search(content):
+                return CHECK_PASS
         return CheckResult(Status.FAIL, self._fail_message)
 
 
-def _make(*, id, name, category, pattern, fail_message, applies_check=None):
+def _make(*, id, name, category, fail_message, pattern=None, applies_check=None, hints=()):
+    """Build a workflow search rule.
+
+    Pass *pattern* (with optional *hints* as a prefilter), or *hints* alone
+    when any one of those literals appearing in a workflow is a match.
+    """
     attrs = {
         "id": id,
         "name": name,
         "category": category,
-        "_pattern": pattern,
+        "_pattern": re.compile(pattern) if pattern else None,
         "_fail_message": fail_message,
+        "_hints": hints,
     }
     if applies_check:
         attrs["_applies_check"] = staticmethod(applies_check)
@@ -55,6 +57,7 @@ CiWorkflowRule = _make(
     pattern=r"tsilva/\.github/.*/(test|release|ci)\.yml|pytest",
     fail_message="No CI workflow referencing test.yml/release.yml/pytest",
     applies_check=lambda r: r.is_python,
+    hints=("pytest", "tsilva/.github"),
 )
 
 ReleaseWorkflowRule = _make(
@@ -64,13 +67,14 @@ ReleaseWorkflowRule = _make(
     pattern=r"tsilva/\.github/.*/(release|publish-pypi)\.yml",
     fail_message="Versioned project missing release workflow",
     applies_check=lambda r: r.has_pyproject and r.has_version,
+    hints=("tsilva/.github",),
 )
 
 PiiScanRule = _make(
     id="PII_SCAN",
     name="PII scanning in CI",
     category=Category.SECURITY,
-    pattern=r"pii-scan\.yml|release\.yml|gitleaks-action",
     fail_message="No PII scanning in CI workflows",
     applies_check=lambda r: r.has_workflows,
+    hints=("pii-scan.yml", "release.yml", "gitleaks-action"),
 )
@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from gitguard.github import get_workflow_conclusions, gh_authenticated
-from gitguard.rules import Category, CheckResult, Rule, Status
+from gitguard.rules import CHECK_PASS, Category, CheckResult, Rule, Status
 
 if TYPE_CHECKING:
     from gitguard.repo import Repo
@@ -29,6 +29,6 @@ class WorkflowsPassingRule(Rule):
             return CheckResult(Status.SKIP, "No completed workflow runs found")
         failed = {name: c for name, c in conclusions.items() if c != "success"}
         if not failed:
-            return CheckResult(Status.PASS)
+            return CHECK_PASS
         details = ", ".join(f"{name}: {c}" for name, c in sorted(failed.items()))
         return CheckResult(Status.FAIL, details)
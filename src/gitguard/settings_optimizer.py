@@ -44,7 +44,7 @@ class Issue:
 class SettingsOptimizer:
     """Analyzes and optimizes Claude Code permission settings."""
 
-    DANGEROUS_PATTERNS = {
+    DANGEROUS_PATTERNS = frozenset({
         "Bash(*:*)",
         "Read(/*)",
         "Write(/*)",
@@ -52,7 +52,7 @@ class SettingsOptimizer:
         "Bash(rm:*)",
         "Bash(sudo:*)",
         "Skill(*)",
-    }
+    })
 
     def __init__(self, global_path: Optional[Path] = None, project_path: Optional[Path] = None):
         self.global_path = global_path or Path.home() / ".claude" / "settings.json"
@@ -11,7 +11,11 @@ def extract_tagline(readme_path: str) -> str:
             content = f.read()
     except Exception:
         return ""
+    return tagline_from_text(content)
 
+
+def tagline_from_text(content: str) -> str:
+    """Tagline from README text that has already been read."""
     lines = content.split("\n")
     in_frontmatter = False
     frontmatter_count = 0
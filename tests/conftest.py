@@ -2,75 +2,132 @@
 
 from __future__ import annotations
 
+import os
+import shutil
 import subprocess
 from pathlib import Path
 
 import pytest
 
-
-@pytest.fixture
-def tmp_repo(tmp_path: Path) -> Path:
-    """Create a minimal git repo with common files for testing."""
-    repo = tmp_path / "test-repo"
+from gitguard.repo import Repo
+from gitguard.rules import Rule
+from gitguard.rules._registry import discover_rules
+
+
+# File bodies for the tmp_repo template, pre-encoded.
+_README = (
+    b"# test-repo\n\nA test repository for unit testing.\n\n## Installation\n\nRun `pip install test-repo`.\n\n"
+    b"## Usage\n\nJust use it.\n\n## License\n\nMIT\n"
+)
+_ESSENTIAL_GITIGNORE = b".env\n.DS_Store\nnode_modules/\n__pycache__/\n*.pyc\n.venv/\n"
+_LICENSE = b"MIT License\n\nCopyright (c) 2024 Test\n"
+_CLAUDE_MD = b"# CLAUDE.md\n\n## Project: test-repo\n"
+_LOGO_PNG = b"\x89PNG\r\n\x1a\n"  # minimal PNG header
+_SETTINGS_LOCAL = (
+    b'{\n  "sandbox": {\n    "enabled": true\n  },\n  "permissions": {\n    "allow": [],\n    "deny": []\n  }\n}\n'
+)
+_DEPENDABOT = (
+    b"version: 2\nupdates:\n  - package-ecosystem: github-actions\n    directory: /\n"
+    b"    schedule:\n      interval: weekly\n"
+)
+_PRE_COMMIT = (
+    b"repos:\n  - repo: https://github.com/tsilva/.github\n    rev: main\n    hooks:\n      - id: gitleaks\n"
+)
+
+# Fixture git output is never read; GITGUARD_TEST_DEBUG=1 keeps it so a failing
+# command's CalledProcessError carries stdout/stderr.
+_GIT_OUTPUT = (
+    {"capture_output": True}
+    if os.environ.get("GITGUARD_TEST_DEBUG")
+    else {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
+)
+
+
+def _git_init(repo: Path) -> None:
+    """git init on main with a test identity, written straight into .git/config."""
+    subprocess.run(["git", "init", "-q", "-b", "main", str(repo)], **_GIT_OUTPUT, check=True)
+    with open(repo / ".git" / "config", "a") as f:
+        f.write("[user]\n\tname = Test\n\temail = test@test.com\n")
+
+
+def _git_commit_all(repo: Path) -> None:
+    subprocess.run(["git", "-C", str(repo), "add", "-A"], **_GIT_OUTPUT, check=True)
+    subprocess.run(["git", "-C", str(repo), "commit", "-q", "-m", "init"], **_GIT_OUTPUT, check=True)
+
+
+@pytest.fixture(scope="session")
+def _tmp_repo_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the tmp_repo contents once per session; tests get copies."""
+    repo = tmp_path_factory.mktemp("template") / "test-repo"
     repo.mkdir()
 
     # Initialize git repo
-    subprocess.run(["git", "init", str(repo)], capture_output=True, check=True)
-    subprocess.run(["git", "-C", str(repo), "config", "user.name", "Test"], capture_output=True, check=True)
-    subprocess.run(["git", "-C", str(repo), "config", "user.email", "test@test.com"], capture_output=True, check=True)
+    _git_init(repo)
 
     # Create basic files
-    (repo / "README.md").write_text(
-        "# test-repo\n\nA test repository for unit testing.\n\n## Installation\n\nRun `pip install test-repo`.\n\n## Usage\n\nJust use it.\n\n## License\n\nMIT\n"
-    )
+    (repo / "README.md").write_bytes(_README)
     from gitguard.rules.gitignore import _load_gitignore_global, _build_managed_block
     global_rules = _load_gitignore_global()
     if global_rules:
         (repo / ".gitignore").write_text(_build_managed_block(global_rules))
     else:
-        (repo / ".gitignore").write_text(".env\n.DS_Store\nnode_modules/\n__pycache__/\n*.pyc\n.venv/\n")
-    (repo / "LICENSE").write_text("MIT License\n\nCopyright (c) 2024 Test\n")
-    (repo / "CLAUDE.md").write_text("# CLAUDE.md\n\n## Project: test-repo\n")
-    (repo / "logo.png").write_bytes(b"\x89PNG\r\n\x1a\n")  # minimal PNG header
+        (repo / ".gitignore").write_bytes(_ESSENTIAL_GITIGNORE)
+    for sub in (".claude", ".github"):
+        (repo / sub).mkdir(parents=True, exist_ok=True)
+    (repo / "LICENSE").write_bytes(_LICENSE)
+    (repo / "CLAUDE.md").write_bytes(_CLAUDE_MD)
+    (repo / "logo.png").write_bytes(_LOGO_PNG)
+    (repo / ".claude" / "settings.local.json").write_bytes(_SETTINGS_LOCAL)  # sandbox enabled
+    (repo / ".github" / "dependabot.yml").write_bytes(_DEPENDABOT)
+    (repo / ".pre-commit-config.yaml").write_bytes(_PRE_COMMIT)
 
-    # Create .claude/settings.local.json with sandbox
-    claude_dir = repo / ".claude"
-    claude_dir.mkdir()
-    (claude_dir / "settings.local.json").write_text('{\n  "sandbox": {\n    "enabled": true\n  },\n  "permissions": {\n    "allow": [],\n    "deny": []\n  }\n}\n')
+    # Commit everything
+    _git_commit_all(repo)
 
-    # Create .github/dependabot.yml
-    gh_dir = repo / ".github"
-    gh_dir.mkdir()
-    (gh_dir / "dependabot.yml").write_text("version: 2\nupdates:\n  - package-ecosystem: github-actions\n    directory: /\n    schedule:\n      interval: weekly\n")
+    return repo
 
-    # Create pre-commit config
-    (repo / ".pre-commit-config.yaml").write_text("repos:\n  - repo: https://github.com/tsilva/.github\n    rev: main\n    hooks:\n      - id: gitleaks\n")
-
-    # Commit everything
-    subprocess.run(["git", "-C", str(repo), "add", "-A"], capture_output=True, check=True)
-    subprocess.run(["git", "-C", str(repo), "commit", "-m", "init"], capture_output=True, check=True)
-    subprocess.run(["git", "-C", str(repo), "branch", "-M", "main"], capture_output=True, check=True)
 
+@pytest.fixture
+def tmp_repo(_tmp_repo_template: Path, tmp_path: Path) -> Path:
+    """Create a minimal git repo with common files for testing."""
+    repo = tmp_path / "test-repo"
+    shutil.copytree(_tmp_repo_template, repo, symlinks=True)
     return repo
 
 
+@pytest.fixture
+def repo(tmp_repo: Path) -> Repo:
+    """A Repo over tmp_repo, for tests that only read from it."""
+    return Repo(path=tmp_repo)
+
+
 @pytest.fixture
 def repos_dir(tmp_repo: Path) -> Path:
     """Return the parent directory containing the test repo."""
     return tmp_repo.parent
 
 
-@pytest.fixture
-def bare_repo(tmp_path: Path) -> Path:
-    """Create a bare-minimum git repo (no files except .git)."""
-    repo = tmp_path / "bare-repo"
+@pytest.fixture(scope="session")
+def _bare_repo_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the bare_repo contents once per session; tests get copies."""
+    repo = tmp_path_factory.mktemp("template") / "bare-repo"
     repo.mkdir()
-    subprocess.run(["git", "init", str(repo)], capture_output=True, check=True)
-    subprocess.run(["git", "-C", str(repo), "config", "user.name", "Test"], capture_output=True, check=True)
-    subprocess.run(["git", "-C", str(repo), "config", "user.email", "test@test.com"], capture_output=True, check=True)
+    _git_init(repo)
     # Need at least one commit for 'main' branch to exist
     (repo / ".gitkeep").write_text("")
-    subprocess.run(["git", "-C", str(repo), "add", "-A"], capture_output=True, check=True)
-    subprocess.run(["git", "-C", str(repo), "commit", "-m", "init"], capture_output=True, check=True)
-    subprocess.run(["git", "-C", str(repo), "branch", "-M", "main"], capture_output=True, check=True)
+    _git_commit_all(repo)
+    return repo
+
+
+@pytest.fixture
+def bare_repo(_bare_repo_template: Path, tmp_path: Path) -> Path:
+    """Create a bare-minimum git repo (no files except .git)."""
+    repo = tmp_path / "bare-repo"
+    shutil.copytree(_bare_repo_template, repo, symlinks=True)
     return repo
+
+
+@pytest.fixture(scope="session")
+def rules() -> tuple[Rule, ...]:
+    """All discovered rules, in canonical order."""
+    return discover_rules()
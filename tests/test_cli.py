@@ -0,0 +1,16 @@
+"""Tests for CLI argument parsing."""
+
+import pytest
+
+from gitguard.cli import _build_maintain_parser
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "x"])
+def test_workers_rejects_non_positive(value, capsys):
+    with pytest.raises(SystemExit):
+        _build_maintain_parser().parse_args(["--workers", value])
+    assert "--workers" in capsys.readouterr().err
+
+
+def test_workers_accepts_positive():
+    assert _build_maintain_parser().parse_args(["-w", "3"]).workers == 3
@@ -1,12 +1,33 @@
 """Tests for RuleRunner engine."""
 
-from gitguard.engine import RuleRunner
+import subprocess
+from unittest.mock import patch
 
+import pytest
 
-def test_run_dry_run_audit(repos_dir):
-    runner = RuleRunner(repos_dir=repos_dir)
-    exit_code = runner.run(dry_run=True)
-    assert exit_code in (0, 1)
+from gitguard import github
+from gitguard.engine import RepoResult, RuleResult, RuleRunner
+from gitguard.rules import repo_description, workflows_passing
+
+
+@pytest.fixture(autouse=True)
+def _offline_gh(monkeypatch):
+    """Run the engine as if gh were not installed.
+
+    Keeps these tests from listing, cloning or editing real GitHub repos on
+    machines where gh is logged in, and from paying for the network calls.
+    """
+    def _no_gh(*args, **kwargs):
+        raise FileNotFoundError("gh")
+
+    def _no() -> bool:
+        return False
+
+    monkeypatch.setattr(github, "_gh", _no_gh)
+    monkeypatch.setattr(github, "gh_available", _no)
+    # Rule modules bind gh_authenticated at import time; stub those names too.
+    for module in (github, repo_description, workflows_passing):
+        monkeypatch.setattr(module, "gh_authenticated", _no)
 
 
 def test_run_json(repos_dir, capsys):
@@ -45,6 +66,27 @@ def test_run_maintain(repos_dir):
     assert exit_code in (0, 1)
 
 
+def test_run_reuses_status_prefetched_by_discovery(repos_dir):
+    subprocess.run(
+        ["git", "-C", str(repos_dir / "test-repo"), "remote", "add", "origin", "git@github.com:tsilva/test-repo.git"],
+        capture_output=True, check=True,
+    )
+    status = {"tsilva/test-repo": {"description": "d", "is_archived": False, "workflow_conclusions": {}}}
+    with patch("gitguard.github.fetch_repo_status_bulk", return_value=status) as bulk, \
+         patch("gitguard.engine.fetch_repo_status_bulk", bulk):
+        RuleRunner(repos_dir=repos_dir).run(dry_run=True)
+    bulk.assert_called_once_with(["tsilva/test-repo"])
+
+
+def test_repo_result_counters():
+    rr = RepoResult(name="r", path="/r")
+    for status in ("pass", "skip", "fixed", "manual", "fix_failed"):
+        rr.add(RuleResult("X", status))
+    assert (rr.total, rr.passed, rr.fixed) == (5, 2, 1)
+    assert [r.status for r in rr.manual] == ["manual", "fix_failed"]
+    assert not rr.all_ok
+
+
 def test_dependency_ordering():
     """Rules that depend on others should come after their dependencies."""
     from gitguard.rules._registry import _CANONICAL_ORDER
@@ -68,3 +110,9 @@ def test_dependency_ordering():
     assert order["SETTINGS_DANGEROUS"] < order["SETTINGS_CLEAN"]
     # PYTHON_PYPROJECT before PYTHON_MIN_VERSION
     assert order["PYTHON_PYPROJECT"] < order["PYTHON_MIN_VERSION"]
+
+
+def test_category_filter(tmp_path):
+    runner = RuleRunner(repos_dir=tmp_path, category_filter="git hygiene")
+    assert {r.id for r in runner._active_rules} == {"DEFAULT_BRANCH", "PENDING_COMMITS", "STALE_BRANCHES"}
+    assert RuleRunner(repos_dir=tmp_path, category_filter="nope")._active_rules == ()
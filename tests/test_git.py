@@ -0,0 +1,78 @@
+"""Tests for git helpers."""
+
+import os
+import time
+
+from gitguard import git
+
+
+def test_untracked_from_status(tmp_repo):
+    (tmp_repo / "README.md").write_text("changed\n")
+    (tmp_repo / "docs").mkdir()
+    (tmp_repo / "docs" / "new.md").write_text("new\n")
+    status = git.status_porcelain(tmp_repo, untracked_all=True)
+    assert git.untracked_from_status(status) == "docs/new.md"
+
+
+def test_diff_head_truncates(tmp_repo):
+    (tmp_repo / "README.md").write_text("".join(f"line {i}\n" for i in range(500)))
+    diff = git.diff_head(tmp_repo, max_lines=20)
+    assert len(diff.splitlines()) == 20
+    assert diff.startswith("diff --git")
+
+
+def test_diff_head_clean(tmp_repo):
+    assert git.diff_head(tmp_repo) == ""
+
+
+def test_diff_head_times_out(tmp_repo):
+    (tmp_repo / ".gitattributes").write_text("README.md diff=slow\n")
+    git.run_git(tmp_repo, "config", "diff.slow.textconv", "sleep 5; cat")
+    (tmp_repo / "README.md").write_text("changed\n")
+    start = time.monotonic()
+    assert git.diff_head(tmp_repo, timeout=0.5) == ""
+    assert time.monotonic() - start < 3
+
+
+def test_tracked_ignored_count_matches_files(tmp_repo):
+    assert git.tracked_ignored_count(tmp_repo) == 0
+    (tmp_repo / ".env").write_text("SECRET=abc\n")
+    (tmp_repo / "caf\u00e9.pyc").write_bytes(b"")
+    git.run_git(tmp_repo, "add", "-f", ".env", "caf\u00e9.pyc")
+    assert git.tracked_ignored_count(tmp_repo) == 2
+    assert sorted(git.tracked_ignored_files(tmp_repo)) == [".env", "caf\u00e9.pyc"]
+
+
+def test_snapshot_clean(tmp_repo):
+    snap = git.snapshot(tmp_repo)
+    assert snap.changes == 0
+    assert snap.ahead == 0
+    assert [name for name, _ in snap.branches] == [name for name, _ in git.branch_ages(tmp_repo)]
+
+
+def test_snapshot_counts_like_porcelain(tmp_repo):
+    (tmp_repo / "README.md").write_text("changed\n")
+    (tmp_repo / "docs").mkdir()
+    (tmp_repo / "docs" / "a.md").write_text("a\n")
+    (tmp_repo / "docs" / "b.md").write_text("b\n")
+    git.run_git(tmp_repo, "mv", "LICENSE", "LICENSE.txt")
+    expected = len(git.status_porcelain(tmp_repo).splitlines())
+    assert git.snapshot(tmp_repo).changes == expected == 3
+
+
+def test_snapshot_ahead_of_upstream(tmp_repo, tmp_path):
+    clone = tmp_path / "clone"
+    git.run_git(tmp_path, "clone", str(tmp_repo), str(clone))
+    git.run_git(clone, "-c", "user.name=T", "-c", "user.email=t@t", "commit", "--allow-empty", "-m", "x")
+    assert git.snapshot(clone).ahead == 1
+    assert len(git.unpushed_commits(clone).splitlines()) == 1
+
+
+def test_needs_fetch(tmp_repo):
+    assert git.needs_fetch(tmp_repo)
+    fetch_head = tmp_repo / ".git" / "FETCH_HEAD"
+    fetch_head.write_text("")
+    assert not git.needs_fetch(tmp_repo)
+    old = time.time() - 3600
+    os.utime(fetch_head, (old, old))
+    assert git.needs_fetch(tmp_repo)
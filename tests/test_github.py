@@ -0,0 +1,85 @@
+"""Tests for gh CLI helpers."""
+
+import json
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from gitguard import github
+
+
+@pytest.fixture(autouse=True)
+def _fresh_auth_cache():
+    github._reset_auth_cache()
+    yield
+    github._reset_auth_cache()
+
+
+def test_gh_authenticated_probes_once():
+    ok = subprocess.CompletedProcess([], 0, stdout="", stderr="")
+    with patch("gitguard.github.shutil.which", return_value="/usr/bin/gh"), \
+         patch("gitguard.github.subprocess.run", return_value=ok) as run:
+        assert github.gh_authenticated()
+        assert github.gh_authenticated()
+    assert run.call_count == 1
+
+
+def test_gh_authenticated_without_gh():
+    with patch("gitguard.github.shutil.which", return_value=None) as which, \
+         patch("gitguard.github.subprocess.run") as run:
+        assert not github.gh_authenticated()
+        assert not github.gh_available()
+    assert which.call_count == 1
+    run.assert_not_called()
+
+
+def test_no_cache_drops_cache_flag(monkeypatch):
+    done = subprocess.CompletedProcess([], 1, stdout="", stderr="")
+    with patch("gitguard.github.subprocess.run", return_value=done) as run:
+        github.fetch_org_repo_metadata("tsilva")
+        assert "--cache" in run.call_args.args[0]
+        monkeypatch.setattr(github, "_cache_enabled", True)
+        github.disable_cache()
+        github.fetch_org_repo_metadata("tsilva")
+        assert "--cache" not in run.call_args.args[0]
+
+
+def test_workflow_conclusions_falls_back_without_jq():
+    runs = (
+        '[{"workflowName": "CI", "status": "completed", "conclusion": "failure"},'
+        ' {"workflowName": "CI", "status": "completed", "conclusion": "success"},'
+        ' {"workflowName": "Release", "status": "in_progress", "conclusion": ""}]'
+    )
+    results = [
+        subprocess.CompletedProcess([], 1, stdout="", stderr="unknown flag: -q"),
+        subprocess.CompletedProcess([], 0, stdout=runs, stderr=""),
+    ]
+    with patch("gitguard.github.subprocess.run", side_effect=results) as run:
+        assert github.get_workflow_conclusions("tsilva/x") == {"CI": "failure"}
+    assert "-q" in run.call_args_list[0].args[0]
+    assert "-q" not in run.call_args_list[1].args[0]
+
+
+def test_status_bulk_tolerates_null_fields():
+    node = {
+        "description": None,
+        "isArchived": False,
+        "ref": {"target": {"history": {"nodes": [
+            {"checkSuites": None},
+            {"checkSuites": {"nodes": [
+                {"status": "COMPLETED", "conclusion": "SUCCESS", "workflowRun": {"workflow": None}},
+                {"status": "COMPLETED", "conclusion": "FAILURE", "workflowRun": {"workflow": {"name": "CI"}}},
+            ]}},
+        ]}}},
+    }
+    results = [
+        subprocess.CompletedProcess([], 0, stdout=json.dumps({"data": {"r0": node}}), stderr=""),
+        subprocess.CompletedProcess([], 0, stdout="[]", stderr=""),
+    ]
+    with patch("gitguard.github.subprocess.run", side_effect=results):
+        status = github.fetch_repo_status_bulk(["tsilva/x"])
+        assert status == {
+            "tsilva/x": {"description": "", "is_archived": False, "workflow_conclusions": {"CI": "failure"}},
+        }
+        assert github.fetch_repo_status_bulk(["tsilva/y"]) == {}
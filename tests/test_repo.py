@@ -18,18 +18,22 @@ def test_discover_filter(repos_dir):
     assert len(Repo.discover(repos_dir, "nonexistent")) == 0
 
 
+def test_discover_filter_glob(repos_dir):
+    assert len(Repo.discover(repos_dir, "test-*")) == 1
+    assert len(Repo.discover(repos_dir, "*-repo")) == 1
+    assert len(Repo.discover(repos_dir, "*-nope")) == 0
+
+
 def test_discover_skips_non_git(tmp_path):
     (tmp_path / "not-a-repo").mkdir()
     assert len(Repo.discover(tmp_path)) == 0
 
 
-def test_repo_name(tmp_repo):
-    repo = Repo(path=tmp_repo)
+def test_repo_name(repo):
     assert repo.name == "test-repo"
 
 
-def test_repo_is_python_false(tmp_repo):
-    repo = Repo(path=tmp_repo)
+def test_repo_is_python_false(repo):
     assert repo.is_python is False
 
 
@@ -39,8 +43,20 @@ def test_repo_is_python_with_pyproject(tmp_repo):
     assert repo.is_python is True
 
 
-def test_repo_has_workflows_false(tmp_repo):
-    repo = Repo(path=tmp_repo)
+def test_repo_is_python_from_py_files(tmp_repo):
+    (tmp_repo / "node_modules" / "pkg").mkdir(parents=True)
+    for name in ("a.py", "b.py", "c.py"):
+        (tmp_repo / "node_modules" / "pkg" / name).write_text("")
+    (tmp_repo / "src").mkdir()
+    (tmp_repo / "src" / "a.py").write_text("")
+    (tmp_repo / "src" / "test_a.py").write_text("")
+    (tmp_repo / "b.py").write_text("")
+    assert Repo(path=tmp_repo).is_python is False
+    (tmp_repo / "src" / "c.py").write_text("")
+    assert Repo(path=tmp_repo).is_python is True
+
+
+def test_repo_has_workflows_false(repo):
     # Our fixture creates .github/dependabot.yml but no workflows dir
     assert repo.has_workflows is False
 
@@ -53,6 +69,18 @@ def test_repo_has_workflows_true(tmp_repo):
     assert repo.has_workflows is True
 
 
+def test_repo_workflow_files(tmp_repo):
+    wf_dir = tmp_repo / ".github" / "workflows"
+    wf_dir.mkdir(parents=True)
+    (wf_dir / "ci.yml").write_text("jobs:\n  test:\n    run: pytest\n")
+    (wf_dir / "notes.txt").write_text("pytest")
+    repo = Repo(path=tmp_repo)
+    assert [p.name for p, _ in repo.workflow_files] == ["ci.yml"]
+    assert repo.has_ci_workflow is True
+    from gitguard.rules.workflow_search import CiWorkflowRule
+    assert CiWorkflowRule().check(repo).status.name == "PASS"
+
+
 def test_parse_github_remote_https():
     assert parse_github_remote("https://github.com/tsilva/.github.git") == "tsilva/.github"
     assert parse_github_remote("https://github.com/owner/repo") == "owner/repo"
@@ -68,40 +96,60 @@ def test_parse_github_remote_invalid():
     assert parse_github_remote("https://gitlab.com/owner/repo") is None
 
 
-def test_is_archived_no_remote(tmp_repo):
-    repo = Repo(path=tmp_repo)
+def test_is_archived_no_remote(repo):
     assert repo.is_archived is False
 
 
 def test_is_archived_gh_fails(tmp_repo):
     repo = Repo(path=tmp_repo)
     repo._cache["github_repo"] = "owner/repo"
-    with patch("gitguard.repo.subprocess.run") as mock_run:
-        mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=1, stdout="", stderr="")
+    failed = subprocess.CompletedProcess(args=[], returncode=1, stdout="", stderr="")
+    with patch("gitguard.github._gh", return_value=failed):
         assert repo.is_archived is False
 
 
 def test_is_archived_true(tmp_repo):
     repo = Repo(path=tmp_repo)
     repo._cache["github_repo"] = "owner/repo"
-    with patch("gitguard.repo.subprocess.run") as mock_run:
-        mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="true\n", stderr="")
+    with patch("gitguard.github.get_repo_archived", return_value=True) as fetch:
         assert repo.is_archived is True
+    fetch.assert_called_once_with("owner/repo")
 
 
 def test_is_archived_gh_not_found(tmp_repo):
     repo = Repo(path=tmp_repo)
     repo._cache["github_repo"] = "owner/repo"
-    with patch("gitguard.repo.subprocess.run", side_effect=FileNotFoundError):
+    with patch("gitguard.github._gh", side_effect=FileNotFoundError):
         assert repo.is_archived is False
 
 
 def test_discover_skip_archived(repos_dir):
-    with patch.object(Repo, "is_archived", new_callable=lambda: property(lambda self: True)):
+    with patch.object(Repo, "_check_archived", return_value=True):
         assert len(Repo.discover(repos_dir)) == 0
 
 
 def test_discover_skip_archived_false(repos_dir):
-    with patch.object(Repo, "is_archived", new_callable=lambda: property(lambda self: True)):
+    with patch.object(Repo, "_check_archived", return_value=True):
         repos = Repo.discover(repos_dir, skip_archived=False)
         assert len(repos) == 1
+
+
+def test_discover_batches_archived_lookup(repos_dir):
+    subprocess.run(
+        ["git", "-C", str(repos_dir / "test-repo"), "remote", "add", "origin", "git@github.com:owner/test-repo.git"],
+        capture_output=True, check=True,
+    )
+    status = {"owner/test-repo": {"description": "d", "is_archived": True, "workflow_conclusions": {}}}
+    with patch("gitguard.github.fetch_repo_status_bulk", return_value=status) as bulk:
+        assert Repo.discover(repos_dir) == []
+    bulk.assert_called_once_with(["owner/test-repo"])
+
+
+def test_entries_cached_until_invalidate(tmp_repo):
+    repo = Repo(path=tmp_repo)
+    assert "README.md" in repo.entries()
+    assert repo.entries(".missing") == frozenset()
+    (tmp_repo / "NEW").write_text("")
+    assert "NEW" not in repo.entries()
+    repo.invalidate()
+    assert "NEW" in repo.entries()
@@ -4,40 +4,41 @@ import json
 import subprocess
 from pathlib import Path
 
+import pytest
+
 from gitguard.repo import Repo
 from gitguard.rules import Status
-from gitguard.rules._registry import discover_rules
-
-
-def test_all_rules_discovered():
-    rules = discover_rules()
-    rule_ids = {r.id for r in rules}
-    expected = {
-        "DEFAULT_BRANCH", "README_EXISTS", "README_CURRENT", "README_LICENSE",
-        "README_LOGO", "LOGO_EXISTS", "LICENSE_EXISTS", "GITIGNORE",
-        "CLAUDE_MD_EXISTS", "CLAUDE_SANDBOX",
-        "DEPENDABOT_EXISTS", "PRECOMMIT_GITLEAKS", "TRACKED_IGNORED",
-        "PENDING_COMMITS", "STALE_BRANCHES", "PYTHON_PYPROJECT",
-        "PYTHON_MIN_VERSION", "SETTINGS_DANGEROUS", "SETTINGS_CLEAN",
-        "README_CI_BADGE", "CI_WORKFLOW", "WORKFLOWS_PASSING", "RELEASE_WORKFLOW",
-        "PII_SCAN", "REPO_DESCRIPTION",
-        "CLI_VERSION", "CLI_PYPI_READY", "CLI_RELEASE_WORKFLOW", "CLI_BUILD_BACKEND",
-        "CLI_EDITABLE_INSTALL",
-    }
-    assert rule_ids == expected
-
-
-def test_canonical_order():
-    rules = discover_rules()
+from gitguard.rules.dependabot_exists import DependabotExistsRule
+from gitguard.rules.file_exists import ClaudeMdExistsRule, LicenseExistsRule
+from gitguard.rules.precommit_gitleaks import PrecommitGitleaksRule
+
+
+EXPECTED_RULE_IDS = frozenset({
+    "DEFAULT_BRANCH", "README_EXISTS", "README_CURRENT", "README_LICENSE",
+    "README_LOGO", "LOGO_EXISTS", "LICENSE_EXISTS", "GITIGNORE",
+    "CLAUDE_MD_EXISTS", "CLAUDE_SANDBOX",
+    "DEPENDABOT_EXISTS", "PRECOMMIT_GITLEAKS", "TRACKED_IGNORED",
+    "PENDING_COMMITS", "STALE_BRANCHES", "PYTHON_PYPROJECT",
+    "PYTHON_MIN_VERSION", "SETTINGS_DANGEROUS", "SETTINGS_CLEAN",
+    "README_CI_BADGE", "CI_WORKFLOW", "WORKFLOWS_PASSING", "RELEASE_WORKFLOW",
+    "PII_SCAN", "REPO_DESCRIPTION",
+    "CLI_VERSION", "CLI_PYPI_READY", "CLI_RELEASE_WORKFLOW", "CLI_BUILD_BACKEND",
+    "CLI_EDITABLE_INSTALL",
+})
+
+
+def test_all_rules_discovered(rules):
+    assert {r.id for r in rules} == EXPECTED_RULE_IDS
+
+
+def test_canonical_order(rules):
     assert rules[0].id == "DEFAULT_BRANCH"
     assert rules[1].id == "LICENSE_EXISTS"
     assert rules[-1].id == "REPO_DESCRIPTION"
 
 
-def test_all_pass_on_complete_repo(tmp_repo):
+def test_all_pass_on_complete_repo(repo, rules):
     """A well-configured repo should pass most checks."""
-    repo = Repo(path=tmp_repo)
-    rules = discover_rules()
 
     passing_ids = set()
     for rule in rules:
@@ -86,34 +87,30 @@ def test_readme_current_short(tmp_repo):
     assert result.status == Status.FAIL
 
 
-def test_license_fix(bare_repo):
+@pytest.mark.parametrize(
+    "rule_cls, rel_path, needle, verified",
+    [
+        (LicenseExistsRule, "LICENSE", "MIT License", True),
+        (ClaudeMdExistsRule, "CLAUDE.md", "bare-repo", True),
+        (DependabotExistsRule, ".github/dependabot.yml", "version: 2", True),
+        (PrecommitGitleaksRule, ".pre-commit-config.yaml", "tsilva/.github", False),
+    ],
+)
+def test_file_rule_fix(bare_repo, rule_cls, rel_path, needle, verified):
     repo = Repo(path=bare_repo)
-    from gitguard.rules.file_exists import LicenseExistsRule
-    rule = LicenseExistsRule()
+    rule = rule_cls()
     assert rule.check(repo).status == Status.FAIL
 
     outcome = rule.fix(repo)
     assert outcome.status == "fixed"
-    assert (bare_repo / "LICENSE").is_file()
-    assert "MIT License" in (bare_repo / "LICENSE").read_text()
+    assert outcome.verified is verified
+    assert (bare_repo / rel_path).is_file()
+    assert needle in (bare_repo / rel_path).read_text()
 
     # Re-check should pass
     assert rule.check(repo).status == Status.PASS
 
 
-def test_claude_md_fix(bare_repo):
-    repo = Repo(path=bare_repo)
-    from gitguard.rules.file_exists import ClaudeMdExistsRule
-    rule = ClaudeMdExistsRule()
-    assert rule.check(repo).status == Status.FAIL
-
-    outcome = rule.fix(repo)
-    assert outcome.status == "fixed"
-    assert (bare_repo / "CLAUDE.md").is_file()
-    content = (bare_repo / "CLAUDE.md").read_text()
-    assert "bare-repo" in content
-
-
 def test_gitignore_fix_incomplete(tmp_repo):
     # Remove some patterns
     (tmp_repo / ".gitignore").write_text("*.pyc\n")
@@ -127,6 +124,15 @@ def test_gitignore_fix_incomplete(tmp_repo):
     assert outcome.status == "fixed"
 
 
+def test_gitignore_patterns_match_whole_lines(tmp_repo):
+    (tmp_repo / ".gitignore").write_text(".envrc\n/.DS_Store\nnode_modules\n__pycache__/\n*.pyc\n.venv/\n")
+    repo = Repo(path=tmp_repo)
+    from gitguard.rules.gitignore import GitignoreRule
+    result = GitignoreRule().check(repo)
+    assert result.status == Status.FAIL
+    assert result.message == "Missing 1 patterns: .env"
+
+
 def test_gitignore_fix_missing(bare_repo):
     repo = Repo(path=bare_repo)
     from gitguard.rules.gitignore import GitignoreRule
@@ -150,35 +156,14 @@ def test_sandbox_fix(bare_repo):
 
     outcome = rule.fix(repo)
     assert outcome.status == "fixed"
+    assert outcome.verified
+    assert rule.check(repo).status == Status.PASS
 
     settings = json.loads((bare_repo / ".claude" / "settings.local.json").read_text())
     assert settings["sandbox"]["enabled"] is True
     assert settings["permissions"] == {"allow": [], "deny": []}
 
 
-def test_dependabot_fix(bare_repo):
-    repo = Repo(path=bare_repo)
-    from gitguard.rules.dependabot_exists import DependabotExistsRule
-    rule = DependabotExistsRule()
-    assert rule.check(repo).status == Status.FAIL
-
-    outcome = rule.fix(repo)
-    assert outcome.status == "fixed"
-    assert (bare_repo / ".github" / "dependabot.yml").is_file()
-
-
-def test_precommit_fix(bare_repo):
-    repo = Repo(path=bare_repo)
-    from gitguard.rules.precommit_gitleaks import PrecommitGitleaksRule
-    rule = PrecommitGitleaksRule()
-    assert rule.check(repo).status == Status.FAIL
-
-    outcome = rule.fix(repo)
-    assert outcome.status == "fixed"
-    config = (bare_repo / ".pre-commit-config.yaml").read_text()
-    assert "tsilva/.github" in config
-
-
 def test_pending_commits_clean(tmp_repo):
     repo = Repo(path=tmp_repo)
     from gitguard.rules.pending_commits import PendingCommitsRule
@@ -202,6 +187,26 @@ def test_stale_branches_clean(tmp_repo):
     assert result.status == Status.PASS
 
 
+def test_stale_branches_merged(tmp_repo):
+    subprocess.run(["git", "-C", str(tmp_repo), "branch", "feature"], capture_output=True, check=True)
+    repo = Repo(path=tmp_repo)
+    from gitguard.rules.stale_branches import StaleBranchesRule
+    result = StaleBranchesRule().check(repo)
+    assert result.status == Status.FAIL
+    assert "feature" in result.message
+
+
+def test_stale_branches_caps_listed_names(tmp_repo):
+    for i in range(12):
+        subprocess.run(["git", "-C", str(tmp_repo), "branch", f"feature-{i:02d}"], capture_output=True, check=True)
+    repo = Repo(path=tmp_repo)
+    from gitguard.rules.stale_branches import StaleBranchesRule
+    result = StaleBranchesRule().check(repo)
+    assert result.message.startswith("12 merged branch(es): feature-00, ")
+    assert "feature-09, +2 more" in result.message
+    assert "feature-10" not in result.message
+
+
 def test_python_pyproject_skip(tmp_repo):
     """Non-Python repos should skip."""
     repo = Repo(path=tmp_repo)
@@ -253,3 +258,20 @@ def test_readme_license_fix(tmp_repo):
     assert outcome.status == "fixed"
     content = (tmp_repo / "README.md").read_text()
     assert "## License" in content
+
+
+def test_repo_description_fix_updates_prefetch(tmp_repo):
+    from unittest.mock import patch
+
+    from gitguard.rules.repo_description import RepoDescriptionRule
+    repo = Repo(path=tmp_repo)
+    repo._cache["github_repo"] = "owner/test-repo"
+    repo._prefetch["description"] = "Old description"
+    rule = RepoDescriptionRule()
+    with patch("gitguard.rules.repo_description.gh_authenticated", return_value=True), \
+         patch("gitguard.rules.repo_description.set_repo_description", return_value=True), \
+         patch("gitguard.rules.repo_description.get_repo_description") as fetch:
+        assert rule.check(repo).status == Status.FAIL
+        assert rule.fix(repo).status == "fixed"
+        assert rule.check(repo).status == Status.PASS
+    fetch.assert_not_called()
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import json
+import subprocess
 from unittest.mock import patch
 
+from gitguard.github import fetch_repo_status_bulk
 from gitguard.repo import Repo
 from gitguard.rules import Status
 from gitguard.rules.workflows_passing import WorkflowsPassingRule
@@ -75,3 +78,23 @@ def test_skip_when_no_github_repo(tmp_path):
     repo = _make_repo(tmp_path, github_repo=None)
     rule = WorkflowsPassingRule()
     assert not rule.applies_to(repo)
+
+
+def test_bulk_conclusions_newest_completed_per_workflow():
+    def suite(status, conclusion, name):
+        return {"status": status, "conclusion": conclusion, "workflowRun": {"workflow": {"name": name}}}
+
+    history = {"nodes": [
+        {"checkSuites": {"nodes": [suite("IN_PROGRESS", None, "CI"), suite("COMPLETED", "FAILURE", "Release")]}},
+        {"checkSuites": {"nodes": [suite("COMPLETED", "SUCCESS", "CI"), suite("COMPLETED", "SUCCESS", "Release")]}},
+    ]}
+    node = {"description": "A repo", "isArchived": False, "ref": {"target": {"history": history}}}
+    payload = {"data": {"r0": node, "r1": None}}
+    done = subprocess.CompletedProcess([], 1, stdout=json.dumps(payload), stderr="")
+    with patch("gitguard.github.subprocess.run", return_value=done):
+        result = fetch_repo_status_bulk(["tsilva/a", "tsilva/gone"])
+    assert result == {"tsilva/a": {
+        "description": "A repo",
+        "is_archived": False,
+        "workflow_conclusions": {"CI": "success", "Release": "failure"},
+    }}